@@ -1,22 +1,20 @@
 """CLI for Continuum - portable context for Claude."""
 
-from datetime import datetime
+import functools
+import importlib
+import os
+import re
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.table import Table
-
-# Load .env from current directory and ~/.continuum/
-load_dotenv()  # Current directory
-load_dotenv(Path.home() / ".continuum" / ".env")  # User's continuum directory
 
 from . import __version__
-from .config import Config, get_default_base_path
-from .export import generate_export, write_export
+from .config import CONTEXT_FILE_TYPES, Config, get_default_base_path, load_env_file
 from .files import (
+    MEMORY_CATEGORIES,
+    append_memory_entry,
     count_memory_entries,
+    create_file,
     extract_current_focus,
     get_file_age_str,
     get_last_export_time,
@@ -24,20 +22,108 @@ from .files import (
     init_project,
     is_stale,
     open_in_editor,
+    scan_dir_stats,
+    today_str,
 )
-from .voice import analyze_voice, generate_voice_md
 
-console = Console()
+# Starter content for project files that `continuum edit --project` creates
+PROJECT_FILE_STUBS = {
+    "identity": b"# Project Identity\n\n",
+    "voice": b"# Project Voice\n\n",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def console():
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_base_path(path: str | None) -> Path:
+    """Resolve a --path option to the Continuum directory (default: ~/.continuum)."""
+    return Path(path).expanduser() if path else get_default_base_path()
+
+
+def load_env_files() -> None:
+    """
+    Load .env from the current directory and ~/.continuum/.
+
+    OPENROUTER_API_KEY is the only variable Continuum reads from them, so
+    both are skipped when it's already set.
+    """
+    if "OPENROUTER_API_KEY" in os.environ:
+        return
+
+    for env_file in (Path(".env"), get_default_base_path() / ".env"):
+        if env_file.is_file():
+            load_env_file(env_file)
+
+
+def load_config(base_path: Path) -> Config:
+    """
+    Load the Config for base_path once per CLI invocation.
+
+    Results are cached on the root Click context, so nested groups and
+    helpers that need the config share a single config.yaml parse.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return Config.load(base_path)
+
+    configs = ctx.find_root().meta.setdefault("continuum.configs", {})
+    if base_path not in configs:
+        configs[base_path] = Config.load(base_path)
+    return configs[base_path]
+
+
+class LazyGroup(click.Group):
+    """Click group that imports some subcommands only when they are used.
+
+    ``lazy_subcommands`` maps a command name to a ``"module:attribute"``
+    import path. The module is imported the first time Click resolves that
+    command, so heavy dependencies stay off the startup path of every
+    other command.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
 
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command {cmd_name!r} did not resolve to a click.Command")
+        return command
 
-@click.group()
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "serve": "continuum.serve_commands:serve",
+        "voice": "continuum.voice_commands:voice",
+    },
+)
 @click.version_option(version=__version__)
 def cli():
     """Continuum - portable context for Claude.
 
     Own your memory, voice, and identity across all Claude interfaces.
     """
-    pass
+    # Runs only when a subcommand is dispatched; Click handles --help and
+    # --version before calling this, so they never touch the filesystem.
+    load_env_files()
 
 
 @cli.command()
@@ -69,46 +155,46 @@ def init(path: str | None, project: bool, force: bool):
             if not click.confirm(f"{continuum_dir} exists. Continue?"):
                 return
 
-        console.print(f"Creating project context in {continuum_dir}...", style="dim")
+        console().print(f"Creating project context in {continuum_dir}...", style="dim")
         actions = init_project(project_root, force=force)
 
         for action in actions:
             if "Created" in action:
-                console.print(f"  [green]{action}[/green]")
+                console().print(f"  [green]{action}[/green]")
             else:
-                console.print(f"  [dim]{action}[/dim]")
+                console().print(f"  [dim]{action}[/dim]")
 
-        console.print()
-        console.print("[bold]Next steps:[/bold]")
-        console.print("  1. Run [cyan]continuum edit context --project[/cyan] to add project details")
-        console.print("  2. Run [cyan]continuum status[/cyan] to see merged context")
-        console.print("  3. Run [cyan]continuum export[/cyan] to export with project context")
+        console().print()
+        console().print("[bold]Next steps:[/bold]")
+        console().print("  1. Run [cyan]continuum edit context --project[/cyan] to add project details")
+        console().print("  2. Run [cyan]continuum status[/cyan] to see merged context")
+        console().print("  3. Run [cyan]continuum export[/cyan] to export with project context")
     else:
         # Global initialization
-        base_path = Path(path).expanduser() if path else get_default_base_path()
+        base_path = resolve_base_path(path)
 
         if base_path.exists() and not force:
             if not click.confirm(f"{base_path} exists. Continue?"):
                 return
 
-        console.print(f"Creating {base_path}...", style="dim")
+        console().print(f"Creating {base_path}...", style="dim")
         actions = init_directory(base_path, force=force)
 
         for action in actions:
             if "Created" in action:
-                console.print(f"  [green]{action}[/green]")
+                console().print(f"  [green]{action}[/green]")
             else:
-                console.print(f"  [dim]{action}[/dim]")
+                console().print(f"  [dim]{action}[/dim]")
 
-        console.print()
-        console.print("[bold]Next steps:[/bold]")
-        console.print("  1. Run [cyan]continuum edit identity[/cyan] to add your information")
-        console.print("  2. Run [cyan]continuum edit voice[/cyan] to define your style")
-        console.print("  3. Run [cyan]continuum export[/cyan] to generate context for Claude Code")
+        console().print()
+        console().print("[bold]Next steps:[/bold]")
+        console().print("  1. Run [cyan]continuum edit identity[/cyan] to add your information")
+        console().print("  2. Run [cyan]continuum edit voice[/cyan] to define your style")
+        console().print("  3. Run [cyan]continuum export[/cyan] to generate context for Claude Code")
 
 
 @cli.command()
-@click.argument("file", type=click.Choice(["identity", "voice", "context", "memory"]))
+@click.argument("file", type=click.Choice(CONTEXT_FILE_TYPES))
 @click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
 @click.option("--project", is_flag=True, help="Edit project-level file instead of global")
 def edit(file: str, path: str | None, project: bool):
@@ -117,13 +203,13 @@ def edit(file: str, path: str | None, project: bool):
     Without --project: edits ~/.continuum/<file>.md
     With --project: edits .continuum/<file>.md in project root
     """
-    base_path = Path(path).expanduser() if path else get_default_base_path()
-    config = Config.load(base_path)
+    base_path = resolve_base_path(path)
+    config = load_config(base_path)
 
     if project:
         if not config.has_project:
-            console.print("[red]No project context found.[/red]")
-            console.print("Run [cyan]continuum init --project[/cyan] first.")
+            console().print("[red]No project context found.[/red]")
+            console().print("Run [cyan]continuum init --project[/cyan] first.")
             return
 
         # Map to project paths
@@ -135,14 +221,14 @@ def edit(file: str, path: str | None, project: bool):
         }
         target_path = project_file_map[file]
 
-        # Create if doesn't exist (for identity/voice which aren't created by default)
-        if not target_path.exists():
-            if file in ("identity", "voice"):
-                console.print(f"[dim]Creating {target_path}...[/dim]")
-                target_path.write_text(f"# Project {file.title()}\n\n")
-            else:
-                console.print(f"[red]{target_path} does not exist.[/red]")
-                return
+        # Create identity/voice on first edit (init --project doesn't); the
+        # exclusive create leaves an existing file untouched
+        if file in PROJECT_FILE_STUBS:
+            if create_file(target_path, PROJECT_FILE_STUBS[file]):
+                console().print(f"[dim]Created {target_path}[/dim]")
+        elif not target_path.exists():
+            console().print(f"[red]{target_path} does not exist.[/red]")
+            return
     else:
         file_map = {
             "identity": config.identity_path,
@@ -153,28 +239,30 @@ def edit(file: str, path: str | None, project: bool):
         target_path = file_map[file]
 
         if not target_path.exists():
-            console.print(f"[red]{target_path} does not exist.[/red]")
-            console.print("Run [cyan]continuum init[/cyan] first.")
+            console().print(f"[red]{target_path} does not exist.[/red]")
+            console().print("Run [cyan]continuum init[/cyan] first.")
             return
 
     if open_in_editor(target_path):
-        console.print(f"[dim]Updated: {target_path}[/dim]")
+        console().print(f"[dim]Updated: {target_path}[/dim]")
     else:
-        console.print(f"[red]Could not open editor. Edit manually: {target_path}[/red]")
+        console().print(f"[red]Could not open editor. Edit manually: {target_path}[/red]")
 
 
 @cli.command()
 @click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
 def status(path: str | None):
     """Show current context status."""
-    base_path = Path(path).expanduser() if path else get_default_base_path()
+    base_path = resolve_base_path(path)
 
     if not base_path.exists():
-        console.print("[red]Continuum not initialized.[/red]")
-        console.print("Run [cyan]continuum init[/cyan] to get started.")
+        console().print("[red]Continuum not initialized.[/red]")
+        console().print("Run [cyan]continuum init[/cyan] to get started.")
         return
 
-    config = Config.load(base_path)
+    from rich.table import Table
+
+    config = load_config(base_path)
 
     # Build global file status table
     table = Table(show_header=False, box=None, padding=(0, 2))
@@ -189,11 +277,15 @@ def status(path: str | None):
         ("memory.md", config.memory_path),
     ]
 
+    # One scandir pass instead of exists/stat calls per file
+    stats = scan_dir_stats(config.base_path)
+
     for name, filepath in files:
-        if filepath.exists():
-            stale = is_stale(filepath, config.stale_days)
+        st = stats.get(name)
+        if st is not None:
+            stale = is_stale(filepath, config.stale_days, st=st)
             status_icon = "[yellow]![/yellow]" if stale else "[green]ok[/green]"
-            age = get_file_age_str(filepath)
+            age = get_file_age_str(filepath, st=st)
             if stale:
                 age = f"[yellow]{age} (stale?)[/yellow]"
             table.add_row(name, status_icon, age)
@@ -213,24 +305,24 @@ def status(path: str | None):
     )
 
     # Print global status
-    console.print()
-    console.print(f"[bold blue]Continuum[/bold blue] [dim]{base_path}[/dim]")
-    console.print()
-    console.print(table)
+    console().print()
+    console().print(f"[bold blue]Continuum[/bold blue] [dim]{base_path}[/dim]")
+    console().print()
+    console().print(table)
 
     # Print additional info
-    console.print()
+    console().print()
     if focus:
-        console.print(f"[bold]Focus:[/bold] {focus}")
+        console().print(f"[bold]Focus:[/bold] {focus}")
     if memory_count:
-        console.print(f"[bold]Memories:[/bold] {memory_count} entries")
-    console.print(f"[bold]Last export:[/bold] {export_str}")
+        console().print(f"[bold]Memories:[/bold] {memory_count} entries")
+    console().print(f"[bold]Last export:[/bold] {export_str}")
 
     # Show project context if present
     if config.has_project:
-        console.print()
-        console.print(f"[bold cyan]Project[/bold cyan] [dim]{config.project_path}[/dim]")
-        console.print()
+        console().print()
+        console().print(f"[bold cyan]Project[/bold cyan] [dim]{config.project_path}[/dim]")
+        console().print()
 
         project_table = Table(show_header=False, box=None, padding=(0, 2))
         project_table.add_column("File", style="bold")
@@ -238,35 +330,37 @@ def status(path: str | None):
         project_table.add_column("Age")
 
         project_files = [
-            ("context.md", config.project_context_path),
-            ("memory.md", config.project_memory_path),
+            ("context.md", config.project_path / "context.md"),
+            ("memory.md", config.project_path / "memory.md"),
         ]
+        project_stats = scan_dir_stats(config.project_path)
 
         for name, filepath in project_files:
-            if filepath and filepath.exists():
-                stale = is_stale(filepath, config.stale_days)
+            st = project_stats.get(name)
+            if st is not None:
+                stale = is_stale(filepath, config.stale_days, st=st)
                 status_icon = "[yellow]![/yellow]" if stale else "[green]ok[/green]"
-                age = get_file_age_str(filepath)
+                age = get_file_age_str(filepath, st=st)
                 if stale:
                     age = f"[yellow]{age} (stale?)[/yellow]"
                 project_table.add_row(name, status_icon, age)
             else:
                 project_table.add_row(name, "[dim]-[/dim]", "[dim]not set[/dim]")
 
-        console.print(project_table)
+        console().print(project_table)
 
         # Project focus
-        if config.project_context_path:
-            project_focus = extract_current_focus(config.project_context_path)
+        if "context.md" in project_stats:
+            project_focus = extract_current_focus(config.project_path / "context.md")
             if project_focus:
-                console.print()
-                console.print(f"[bold]Project focus:[/bold] {project_focus}")
+                console().print()
+                console().print(f"[bold]Project focus:[/bold] {project_focus}")
 
         # Project memory count
-        if config.project_memory_path:
-            project_memory_count = count_memory_entries(config.project_memory_path)
+        if "memory.md" in project_stats:
+            project_memory_count = count_memory_entries(config.project_path / "memory.md")
             if project_memory_count:
-                console.print(f"[bold]Project memories:[/bold] {project_memory_count} entries")
+                console().print(f"[bold]Project memories:[/bold] {project_memory_count} entries")
 
 
 @cli.command()
@@ -274,7 +368,7 @@ def status(path: str | None):
 @click.option(
     "--category",
     "-c",
-    type=click.Choice(["fact", "decision", "lesson", "preference"]),
+    type=click.Choice(MEMORY_CATEGORIES),
     default=None,
     help="Memory category (auto-detected if not specified)",
 )
@@ -286,13 +380,13 @@ def remember(text: str, category: str | None, path: str | None, project: bool):
     Without --project: adds to ~/.continuum/memory.md
     With --project: adds to .continuum/memory.md in project root
     """
-    base_path = Path(path).expanduser() if path else get_default_base_path()
-    config = Config.load(base_path)
+    base_path = resolve_base_path(path)
+    config = load_config(base_path)
 
     if project:
         if not config.has_project:
-            console.print("[red]No project context found.[/red]")
-            console.print("Run [cyan]continuum init --project[/cyan] first.")
+            console().print("[red]No project context found.[/red]")
+            console().print("Run [cyan]continuum init --project[/cyan] first.")
             return
         memory_path = config.project_path / "memory.md"
         label = "project memory"
@@ -301,11 +395,11 @@ def remember(text: str, category: str | None, path: str | None, project: bool):
         label = "memory.md"
 
     if not memory_path.exists():
-        console.print(f"[red]{memory_path} not found.[/red]")
+        console().print(f"[red]{memory_path} not found.[/red]")
         if project:
-            console.print("Run [cyan]continuum init --project[/cyan] first.")
+            console().print("Run [cyan]continuum init --project[/cyan] first.")
         else:
-            console.print("Run [cyan]continuum init[/cyan] first.")
+            console().print("Run [cyan]continuum init[/cyan] first.")
         return
 
     # Auto-detect category if not specified
@@ -313,33 +407,49 @@ def remember(text: str, category: str | None, path: str | None, project: bool):
         category = auto_detect_category(text)
 
     # Format entry
-    date = datetime.now().strftime("%Y-%m-%d")
+    date = today_str()
     entry = f"[{date}] {category.upper()} - {text}"
 
     # Append to memory.md
-    with open(memory_path, "a") as f:
-        f.write(f"\n{entry}")
+    append_memory_entry(memory_path, entry)
 
-    console.print(f"[green]Added to {label}:[/green]")
-    console.print(f"  {entry}")
+    console().print(f"[green]Added to {label}:[/green]")
+    console().print(f"  {entry}")
 
 
-def auto_detect_category(text: str) -> str:
-    """Infer category from text content."""
-    text_lower = text.lower()
+# Checked in order: the first category with any matching keyword wins
+_CATEGORY_KEYWORDS = (
+    ("decision", ("decided", "chose", "picked", "selected", "going with", "went with")),
+    ("lesson", ("learned", "realized", "discovered", "found out", "turns out")),
+    ("preference", ("prefer", "like", "want", "always", "never", "don't like")),
+)
+_CATEGORY_RANK = {category: rank for rank, (category, _) in enumerate(_CATEGORY_KEYWORDS)}
+
+# All keywords in one case-insensitive pattern, one named group per category.
+# The match is a lookahead, so finditer tries every position and keywords that
+# overlap one another are all seen in a single pass over the text.
+_CATEGORY_RE = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+        for category, keywords in _CATEGORY_KEYWORDS
+    )
+    + ")",
+    re.IGNORECASE,
+)
 
-    decision_keywords = ["decided", "chose", "picked", "selected", "going with", "went with"]
-    lesson_keywords = ["learned", "realized", "discovered", "found out", "turns out"]
-    preference_keywords = ["prefer", "like", "want", "always", "never", "don't like"]
 
-    if any(w in text_lower for w in decision_keywords):
-        return "decision"
-    elif any(w in text_lower for w in lesson_keywords):
-        return "lesson"
-    elif any(w in text_lower for w in preference_keywords):
-        return "preference"
+def auto_detect_category(text: str) -> str:
+    """Infer category from text content."""
+    best = None
+    for match in _CATEGORY_RE.finditer(text):
+        category = match.lastgroup
+        if best is None or _CATEGORY_RANK[category] < _CATEGORY_RANK[best]:
+            best = category
+            if _CATEGORY_RANK[best] == 0:
+                break
 
-    return "fact"
+    return best or "fact"
 
 
 @cli.command("export")
@@ -348,14 +458,16 @@ def auto_detect_category(text: str) -> str:
 @click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
 def export_cmd(output: str | None, stdout: bool, path: str | None):
     """Export context for Claude Code."""
-    base_path = Path(path).expanduser() if path else get_default_base_path()
+    base_path = resolve_base_path(path)
 
     if not base_path.exists():
-        console.print("[red]Continuum not initialized.[/red]")
-        console.print("Run [cyan]continuum init[/cyan] first.")
+        console().print("[red]Continuum not initialized.[/red]")
+        console().print("Run [cyan]continuum init[/cyan] first.")
         return
 
-    config = Config.load(base_path)
+    from .export import generate_export, write_export
+
+    config = load_config(base_path)
 
     if stdout:
         content = generate_export(config)
@@ -363,30 +475,30 @@ def export_cmd(output: str | None, stdout: bool, path: str | None):
     else:
         output_path = Path(output).expanduser() if output else None
         result_path = write_export(config, output_path)
-        console.print(f"[green]Exported to {result_path}[/green]")
-        console.print()
-        console.print("To use with Claude Code:")
-        console.print(f"  1. Copy to your project: [cyan]cp {result_path} ./CONTEXT.md[/cyan]")
-        console.print("  2. Reference in CLAUDE.md: [cyan]See CONTEXT.md for user context[/cyan]")
+        console().print(f"[green]Exported to {result_path}[/green]")
+        console().print()
+        console().print("To use with Claude Code:")
+        console().print(f"  1. Copy to your project: [cyan]cp {result_path} ./CONTEXT.md[/cyan]")
+        console().print("  2. Reference in CLAUDE.md: [cyan]See CONTEXT.md for user context[/cyan]")
 
 
 @cli.command()
 @click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
 def validate(path: str | None):
     """Validate Continuum files."""
-    base_path = Path(path).expanduser() if path else get_default_base_path()
+    base_path = resolve_base_path(path)
 
     if not base_path.exists():
-        console.print("[red]Continuum not initialized.[/red]")
-        console.print("Run [cyan]continuum init[/cyan] first.")
+        console().print("[red]Continuum not initialized.[/red]")
+        console().print("Run [cyan]continuum init[/cyan] first.")
         return
 
-    config = Config.load(base_path)
+    config = load_config(base_path)
     issues = []
     warnings = []
 
-    console.print("[bold]Validating Continuum files...[/bold]")
-    console.print()
+    console().print("[bold]Validating Continuum files...[/bold]")
+    console().print()
 
     # Check each file
     files = [
@@ -396,331 +508,49 @@ def validate(path: str | None):
         ("memory.md", config.memory_path, []),
     ]
 
+    stats = scan_dir_stats(config.base_path)
+
     for name, filepath, required_sections in files:
-        console.print(f"[bold]{name}[/bold]")
+        console().print(f"[bold]{name}[/bold]")
 
-        if not filepath.exists():
-            console.print("  [red]x File missing[/red]")
+        st = stats.get(name)
+        if st is None:
+            console().print("  [red]x File missing[/red]")
             issues.append(f"{name} missing")
             continue
 
-        console.print("  [green]ok[/green] File exists")
+        console().print("  [green]ok[/green] File exists")
 
-        # Check for required sections
-        content = filepath.read_text()
+        # Check for required sections (memory.md has none, so skip reading it
+        # here; count_memory_entries streams it below)
+        content = filepath.read_text().lower() if required_sections else ""
         for section in required_sections:
-            if section.lower() in content.lower():
-                console.print(f"  [green]ok[/green] Has '{section}' section")
+            if section.lower() in content:
+                console().print(f"  [green]ok[/green] Has '{section}' section")
             else:
-                console.print(f"  [yellow]![/yellow] Missing '{section}' section")
+                console().print(f"  [yellow]![/yellow] Missing '{section}' section")
                 warnings.append(f"{name}: missing {section}")
 
         # Check staleness
-        if is_stale(filepath, config.stale_days):
-            age = get_file_age_str(filepath)
-            console.print(f"  [yellow]![/yellow] Updated {age} (may be stale)")
+        if is_stale(filepath, config.stale_days, st=st):
+            age = get_file_age_str(filepath, st=st)
+            console().print(f"  [yellow]![/yellow] Updated {age} (may be stale)")
             warnings.append(f"{name}: possibly stale")
 
         # Special checks for memory.md
         if name == "memory.md":
             count = count_memory_entries(filepath)
-            console.print(f"  [dim]{count} entries[/dim]")
+            console().print(f"  [dim]{count} entries[/dim]")
 
-        console.print()
+        console().print()
 
     # Summary
     if issues:
-        console.print(f"[red]Issues: {len(issues)}[/red]")
+        console().print(f"[red]Issues: {len(issues)}[/red]")
     if warnings:
-        console.print(f"[yellow]Warnings: {len(warnings)}[/yellow]")
+        console().print(f"[yellow]Warnings: {len(warnings)}[/yellow]")
     if not issues and not warnings:
-        console.print("[green]All files valid[/green]")
-
-
-@cli.group()
-def voice():
-    """Voice profile commands."""
-    pass
-
-
-@voice.command("analyze")
-@click.option(
-    "--samples",
-    type=click.Path(exists=True),
-    default=None,
-    help="Path to samples directory (default: ~/.continuum/samples)",
-)
-@click.option(
-    "--model",
-    default="google/gemini-3-flash-preview",
-    help="OpenRouter model to use for analysis",
-)
-@click.option("--dry-run", is_flag=True, help="Show analysis without updating voice.md")
-@click.option("--raw", is_flag=True, help="Show raw API response")
-@click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
-def voice_analyze(
-    samples: str | None,
-    model: str,
-    dry_run: bool,
-    raw: bool,
-    path: str | None,
-):
-    """Analyze writing samples to generate voice profile.
-
-    Reads samples from ~/.continuum/samples/ (or --samples path) and uses
-    an LLM to extract voice patterns, vocabulary, and structural preferences.
-
-    Requires OPENROUTER_API_KEY environment variable.
-
-    Example:
-        continuum voice analyze
-        continuum voice analyze --dry-run
-        continuum voice analyze --samples ~/my-emails/
-    """
-    import os
-
-    base_path = Path(path).expanduser() if path else get_default_base_path()
-    config = Config.load(base_path)
-
-    samples_path = Path(samples).expanduser() if samples else config.base_path / "samples"
-
-    # Check for API key early
-    if not os.environ.get("OPENROUTER_API_KEY"):
-        console.print("[red]Error: OPENROUTER_API_KEY environment variable not set[/red]")
-        console.print()
-        console.print("Set it with:")
-        console.print("  export OPENROUTER_API_KEY=your-key-here")
-        return
-
-    # Check for samples
-    if not samples_path.exists():
-        console.print(f"[red]Samples directory not found: {samples_path}[/red]")
-        console.print()
-        console.print("Create it and add writing samples:")
-        console.print(f"  mkdir -p {samples_path}/emails")
-        console.print(f"  mkdir -p {samples_path}/technical")
-        console.print("  # Add .md or .txt files to these directories")
-        return
-
-    # Count samples
-    sample_count = 0
-    for item in samples_path.rglob("*"):
-        if item.is_file() and item.suffix in (".md", ".txt", ".eml", ""):
-            sample_count += 1
-
-    if sample_count == 0:
-        console.print(f"[red]No samples found in {samples_path}[/red]")
-        console.print("Add .md, .txt, or .eml files to analyze.")
-        return
-
-    console.print(f"[bold]Analyzing {sample_count} samples...[/bold]")
-    console.print(f"  Samples: {samples_path}")
-    console.print(f"  Model: {model}")
-    console.print()
-
-    with console.status("[bold green]Calling API..."):
-        result = analyze_voice(config, samples_path, model=model)
-
-    if result.error:
-        console.print(f"[red]Error: {result.error}[/red]")
-        return
-
-    if raw:
-        console.print("[bold]Raw API Response:[/bold]")
-        console.print(result.raw_response)
-        return
-
-    if not result.parsed:
-        console.print("[yellow]Warning: Could not parse structured response[/yellow]")
-        console.print()
-        console.print("[bold]Raw response:[/bold]")
-        console.print(result.raw_response)
-        return
-
-    # Generate voice.md content
-    voice_content = generate_voice_md(result.parsed)
-
-    if dry_run:
-        console.print("[bold]Generated voice.md (dry run):[/bold]")
-        console.print()
-        console.print(voice_content)
-        console.print()
-        console.print("[dim]Use without --dry-run to update voice.md[/dim]")
-    else:
-        # Write to voice.md
-        voice_path = config.voice_path
-        voice_path.write_text(voice_content)
-        console.print(f"[green]Updated {voice_path}[/green]")
-        console.print()
-        console.print("Review with:")
-        console.print(f"  continuum edit voice")
-
-
-@voice.command("samples")
-@click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
-def voice_samples(path: str | None):
-    """Show sample collection status."""
-    base_path = Path(path).expanduser() if path else get_default_base_path()
-    samples_path = base_path / "samples"
-
-    if not samples_path.exists():
-        console.print(f"[yellow]Samples directory not found: {samples_path}[/yellow]")
-        console.print()
-        console.print("Create it with:")
-        console.print(f"  mkdir -p {samples_path}/emails")
-        console.print(f"  mkdir -p {samples_path}/technical")
-        console.print(f"  mkdir -p {samples_path}/feedback")
-        return
-
-    console.print(f"[bold]Samples directory: {samples_path}[/bold]")
-    console.print()
-
-    # Count by category
-    total = 0
-    for item in sorted(samples_path.iterdir()):
-        if item.is_dir():
-            count = len(list(item.glob("*")))
-            total += count
-            status = "[green]" if count > 0 else "[dim]"
-            console.print(f"  {status}{item.name}/[/] {count} files")
-        elif item.is_file():
-            total += 1
-            console.print(f"  {item.name}")
-
-    console.print()
-    console.print(f"[bold]Total: {total} samples[/bold]")
-
-    if total == 0:
-        console.print()
-        console.print("[dim]Add writing samples (.md, .txt, .eml) to analyze[/dim]")
-
-
-@cli.group()
-def serve():
-    """MCP server commands."""
-    pass
-
-
-@serve.command("stdio")
-def serve_stdio():
-    """Run MCP server with stdio transport (for local Claude Code/Desktop)."""
-    from .mcp_server import run_stdio
-
-    console.print("[bold]Starting Continuum MCP server (stdio)...[/bold]")
-    run_stdio()
-
-
-@serve.command("http")
-@click.option("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0 for Tailscale)")
-@click.option("--port", default=8765, help="Port to listen on (default: 8765)")
-def serve_http(host: str, port: int):
-    """Run MCP server with Streamable HTTP transport (recommended for remote access).
-
-    This starts an HTTP server that Claude can connect to remotely.
-    Use with Tailscale for secure access from any device.
-
-    Example:
-        continuum serve http
-        continuum serve http --port 9000
-    """
-    from .mcp_server import run_http
-
-    console.print(f"[bold]Starting Continuum MCP server (Streamable HTTP)...[/bold]")
-    console.print(f"  Host: {host}")
-    console.print(f"  Port: {port}")
-    console.print()
-    run_http(host=host, port=port)
-
-
-@serve.command("sse")
-@click.option("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0 for Tailscale)")
-@click.option("--port", default=8765, help="Port to listen on (default: 8765)")
-def serve_sse(host: str, port: int):
-    """Run MCP server with SSE transport (legacy, use 'serve http' instead).
-
-    This starts an HTTP server that Claude can connect to remotely.
-    Use with Tailscale for secure access from any device.
-
-    Example:
-        continuum serve sse
-        continuum serve sse --port 9000
-    """
-    from .mcp_server import run_sse
-
-    console.print(f"[bold]Starting Continuum MCP server (SSE)...[/bold]")
-    console.print(f"  [yellow]Note: SSE is legacy. Consider 'continuum serve http' instead.[/yellow]")
-    console.print(f"  Host: {host}")
-    console.print(f"  Port: {port}")
-    console.print()
-    run_sse(host=host, port=port)
-
-
-@serve.command("config")
-@click.option("--sse", is_flag=True, help="Show legacy SSE config instead of Streamable HTTP")
-@click.option("--http", "use_http", is_flag=True, help="Show Streamable HTTP config (default for remote)")
-@click.option("--port", default=8765, help="Port for remote server")
-def serve_config(sse: bool, use_http: bool, port: int):
-    """Show MCP configuration for Claude Code or Claude Desktop.
-
-    Without flags: shows stdio config (local).
-    With --http: shows Streamable HTTP config (recommended for remote).
-    With --sse: shows legacy SSE config (for older clients).
-    """
-    import json
-    import subprocess
-
-    if sse or use_http:
-        # Get Tailscale hostname
-        try:
-            result = subprocess.run(
-                ["tailscale", "status", "--json"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            ts_status = json.loads(result.stdout)
-            hostname = ts_status.get("Self", {}).get("DNSName", "").rstrip(".")
-            if not hostname:
-                hostname = "<your-tailscale-hostname>"
-        except Exception:
-            hostname = "<your-tailscale-hostname>"
-
-        if sse:
-            config = {
-                "continuum": {
-                    "transport": "sse",
-                    "url": f"https://{hostname}/mcp/sse",
-                }
-            }
-            console.print("[bold]SSE MCP Config (legacy, for remote Claude):[/bold]")
-        else:
-            config = {
-                "continuum": {
-                    "transport": "http",
-                    "url": f"https://{hostname}/mcp",
-                }
-            }
-            console.print("[bold]Streamable HTTP MCP Config (for remote Claude):[/bold]")
-    else:
-        # Find the continuum-mcp executable
-        import shutil
-
-        mcp_path = shutil.which("continuum-mcp")
-        if not mcp_path:
-            mcp_path = "continuum-mcp"
-
-        config = {
-            "continuum": {
-                "command": mcp_path,
-                "args": [],
-            }
-        }
-        console.print("[bold]Stdio MCP Config (for local Claude Code):[/bold]")
-
-    console.print()
-    console.print(json.dumps(config, indent=2))
-    console.print()
-    console.print("[dim]Add this to your MCP settings file.[/dim]")
+        console().print("[green]All files valid[/green]")
 
 
 if __name__ == "__main__":
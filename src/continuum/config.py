@@ -1,11 +1,33 @@
 """Configuration management for Continuum."""
 
+import functools
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+CONTEXT_FILE_TYPES = ("identity", "voice", "context", "memory")
+
+_PROJECT_MARKERS = frozenset(
+    {".continuum", ".git", "pyproject.toml", "package.json", "Cargo.toml"}
+)
+
+
+# Walk results by resolved start path: the directories listed, each with the
+# mtime it had when listed, and the root found (or None). Holds at most
+# _ROOT_CACHE_SIZE start paths; when full, the oldest entry is evicted first.
+_root_cache: dict[Path, tuple[tuple[tuple[Path, int | None], ...], Path | None]] = {}
+_ROOT_CACHE_SIZE = 32
+
 
 def find_project_root(start_path: Path | None = None) -> Path | None:
     """
@@ -13,21 +35,52 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
 
     Searches from start_path up to filesystem root.
     Returns None if no project markers found.
+
+    Results are cached per resolved start path and revalidated with one
+    stat per directory the walk listed: adding or removing a marker changes
+    its directory's mtime, so the next call walks again. Call
+    clear_project_root_cache() to drop the cache entirely.
     """
     if start_path is None:
         start_path = Path.cwd()
-
-    start_path = start_path.resolve()
-    markers = [".continuum", ".git", "pyproject.toml", "package.json", "Cargo.toml"]
-
+    start = start_path.resolve()
+
+    cached = _root_cache.get(start)
+    if cached is not None:
+        listed, root = cached
+        if all(_mtime_ns(directory) == mtime for directory, mtime in listed):
+            return root
+
+    listed, root = _walk_to_project_root(start)
+    if len(_root_cache) >= _ROOT_CACHE_SIZE:
+        del _root_cache[next(iter(_root_cache))]
+    _root_cache[start] = (listed, root)
+    return root
+
+
+def _walk_to_project_root(
+    start_path: Path,
+) -> tuple[tuple[tuple[Path, int | None], ...], Path | None]:
+    """Uncached walk for find_project_root(); one directory listing per level."""
+    listed = []
     current = start_path
     while current != current.parent:
-        for marker in markers:
-            if (current / marker).exists():
-                return current
+        # Taken before listing, so a marker added mid-walk invalidates the entry
+        listed.append((current, _mtime_ns(current)))
+        try:
+            with os.scandir(current) as it:
+                if any(entry.name in _PROJECT_MARKERS for entry in it):
+                    return tuple(listed), current
+        except OSError:
+            pass
         current = current.parent
 
-    return None
+    return tuple(listed), None
+
+
+def clear_project_root_cache() -> None:
+    """Drop all project roots cached by find_project_root()."""
+    _root_cache.clear()
 
 
 @dataclass
@@ -43,9 +96,22 @@ class Config:
     identity_max_words: int = 500
 
     # Paths (set after load)
-    base_path: Path = field(default_factory=lambda: Path.home() / ".continuum")
+    base_path: Path = field(default_factory=lambda: get_default_base_path())
     project_path: Path | None = None  # .continuum/ in project root, if exists
 
+    # Context files found at construction time, keyed by file type
+    _global_files: dict[str, Path] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _project_files: dict[str, Path] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        self._global_files = _existing_context_files(self.base_path)
+        if self.project_path:
+            self._project_files = _existing_context_files(self.project_path)
+
     @classmethod
     def load(
         cls,
@@ -65,7 +131,7 @@ class Config:
             start_path: Starting path for project root detection (default: cwd)
         """
         if base_path is None:
-            base_path = Path.home() / ".continuum"
+            base_path = get_default_base_path()
 
         # Start with defaults
         config_data: dict[str, Any] = {}
@@ -75,7 +141,7 @@ class Config:
         if global_config_file.exists():
             try:
                 with open(global_config_file) as f:
-                    config_data = yaml.safe_load(f) or {}
+                    config_data = yaml.load(f, Loader=_YamlLoader) or {}
             except Exception:
                 pass
 
@@ -93,13 +159,51 @@ class Config:
                     if project_config_file.exists():
                         try:
                             with open(project_config_file) as f:
-                                project_data = yaml.safe_load(f) or {}
+                                project_data = yaml.load(f, Loader=_YamlLoader) or {}
                                 config_data.update(project_data)
                         except Exception:
                             pass
 
         return cls._from_dict(config_data, base_path, project_path)
 
+    @classmethod
+    def load_cached(
+        cls,
+        base_path: Path | None = None,
+        start_path: Path | None = None,
+    ) -> "Config":
+        """
+        Load configuration, reusing the previous result while inputs are unchanged.
+
+        Intended for long-lived processes such as the MCP server. The cache key
+        includes the resolved start path, the project .continuum/ candidate
+        under the current project root, and the mtimes of both config.yaml
+        files and of the global and project directories. Edits, created or
+        deleted context files, and project directories created later (even
+        where no project marker existed before; see find_project_root) are
+        picked up on the next call. Returned configs are shared; don't
+        mutate them.
+        """
+        if base_path is None:
+            base_path = get_default_base_path()
+        start = (start_path or Path.cwd()).resolve()
+
+        project_root = find_project_root(start)
+        candidate = project_root / ".continuum" if project_root else None
+        mtimes = (
+            _mtime_ns(base_path),
+            _mtime_ns(base_path / "config.yaml"),
+            _mtime_ns(candidate),
+            _mtime_ns(candidate / "config.yaml") if candidate else None,
+        )
+        return _load_cached(base_path, start, candidate, mtimes)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all configs memoized by load_cached(), and the project roots behind them."""
+        _load_cached.cache_clear()
+        clear_project_root_cache()
+
     @classmethod
     def _from_dict(
         cls, data: dict[str, Any], base_path: Path, project_path: Path | None = None
@@ -140,34 +244,22 @@ class Config:
     def exports_path(self) -> Path:
         return self.base_path / "exports"
 
-    # Project paths (return None if no project)
+    # Project paths (return None if no project or the file doesn't exist)
     @property
     def project_identity_path(self) -> Path | None:
-        if self.project_path:
-            p = self.project_path / "identity.md"
-            return p if p.exists() else None
-        return None
+        return self._project_files.get("identity")
 
     @property
     def project_voice_path(self) -> Path | None:
-        if self.project_path:
-            p = self.project_path / "voice.md"
-            return p if p.exists() else None
-        return None
+        return self._project_files.get("voice")
 
     @property
     def project_context_path(self) -> Path | None:
-        if self.project_path:
-            p = self.project_path / "context.md"
-            return p if p.exists() else None
-        return None
+        return self._project_files.get("context")
 
     @property
     def project_memory_path(self) -> Path | None:
-        if self.project_path:
-            p = self.project_path / "memory.md"
-            return p if p.exists() else None
-        return None
+        return self._project_files.get("memory")
 
     def get_effective_path(self, file_type: str) -> Path | None:
         """
@@ -176,32 +268,84 @@ class Config:
         For identity and voice, project overrides global.
         Returns None if file doesn't exist at either level.
         """
-        project_paths = {
-            "identity": self.project_identity_path,
-            "voice": self.project_voice_path,
-            "context": self.project_context_path,
-            "memory": self.project_memory_path,
-        }
-        global_paths = {
-            "identity": self.identity_path,
-            "voice": self.voice_path,
-            "context": self.context_path,
-            "memory": self.memory_path,
-        }
-
         # Project overrides global for identity/voice
         if file_type in ("identity", "voice"):
-            project_p = project_paths.get(file_type)
-            if project_p and project_p.exists():
+            project_p = self._project_files.get(file_type)
+            if project_p:
                 return project_p
 
-        global_p = global_paths.get(file_type)
-        if global_p and global_p.exists():
-            return global_p
+        return self._global_files.get(file_type)
 
+
+def _existing_context_files(directory: Path) -> dict[str, Path]:
+    """Map each context file type to its path under directory, if it exists."""
+    found = {}
+    for file_type in CONTEXT_FILE_TYPES:
+        path = directory / f"{file_type}.md"
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        found[file_type] = path
+    return found
+
+
+def _mtime_ns(path: Path | None) -> int | None:
+    """Return a path's mtime in nanoseconds, or None if it doesn't exist."""
+    if path is None:
         return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(
+    base_path: Path,
+    start_path: Path,
+    candidate: Path | None,
+    mtimes: tuple[int | None, ...],
+) -> Config:
+    """Cached Config.load(); candidate and mtimes are only part of the key."""
+    return Config.load(base_path=base_path, start_path=start_path)
 
 
+@functools.lru_cache(maxsize=None)
 def get_default_base_path() -> Path:
-    """Get the default base path for Continuum."""
+    """Get the default base path for Continuum (computed once per process)."""
     return Path.home() / ".continuum"
+
+
+def load_env_file(path: Path) -> None:
+    """
+    Load KEY=value lines from a .env file into os.environ.
+
+    Variables already set in the environment take precedence. Supports
+    blank lines, # comments, an optional "export " prefix, and single- or
+    double-quoted values; unquoted values may end in a " # comment".
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export ") :].strip()
+        if not key:
+            continue
+
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+
+        os.environ.setdefault(key, value)
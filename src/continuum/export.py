@@ -1,10 +1,17 @@
 """Export generation for Continuum."""
 
+import functools
+import heapq
+import re
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from .config import Config
 
+# "[YYYY-MM-DD]" or "[YYYY-MM]" at the start of a stripped memory line
+_ENTRY_DATE_RE = re.compile(r"\[\s*(\d{4})-(\d{1,2})(?:-(\d{1,2}))?\s*\]")
+
 
 def generate_export(config: Config) -> str:
     """
@@ -34,76 +41,77 @@ def generate_export(config: Config) -> str:
     ]
 
     # Identity (condensed) - project overrides global
-    identity_path = config.project_identity_path or (
-        config.identity_path if config.identity_path.exists() else None
-    )
-    if identity_path:
-        identity = identity_path.read_text()
-        parts.append("## Identity")
-        parts.append("")
-        parts.append(condense_content(identity, config.identity_max_words))
-        parts.append("")
+    identity = _read_optional(config.project_identity_path)
+    if identity is None:
+        identity = _read_optional(config.identity_path)
+    if identity is not None:
+        parts += ["## Identity", "", condense_content(identity, config.identity_max_words), ""]
 
     # Voice (full) - project overrides global
-    voice_path = config.project_voice_path or (
-        config.voice_path if config.voice_path.exists() else None
-    )
-    if voice_path:
-        voice = voice_path.read_text()
-        parts.append("## Voice & Communication Style")
-        parts.append("")
-        parts.append(voice.strip())
-        parts.append("")
+    voice = _read_optional(config.project_voice_path)
+    if voice is None:
+        voice = _read_optional(config.voice_path)
+    if voice is not None:
+        parts += ["## Voice & Communication Style", "", voice.strip(), ""]
 
     # Context (full) - merge global + project
-    context_parts = []
-    if config.context_path.exists():
-        context_parts.append(config.context_path.read_text().strip())
-    if config.project_context_path:
-        context_parts.append(config.project_context_path.read_text().strip())
-
+    context_parts = [
+        text.strip()
+        for text in (
+            _read_optional(config.context_path),
+            _read_optional(config.project_context_path),
+        )
+        if text is not None
+    ]
     if context_parts:
-        parts.append("## Current Context")
-        parts.append("")
-        parts.append("\n\n---\n\n".join(context_parts))
-        parts.append("")
-
-    # Memory (filtered) - merge global + project
-    memory_texts = []
-    if config.memory_path.exists():
-        memory_texts.append(config.memory_path.read_text())
+        parts += ["## Current Context", "", "\n\n---\n\n".join(context_parts), ""]
+
+    # Memory (filtered) - merge global + project. The files are streamed line
+    # by line, so a long memory history is never held in memory as one string.
+    memory_paths = [config.memory_path]
     if config.project_memory_path:
-        memory_texts.append(config.project_memory_path.read_text())
+        memory_paths.append(config.project_memory_path)
 
-    if memory_texts:
-        combined_memory = "\n\n".join(memory_texts)
-        filtered_memory = filter_recent_memory(
-            combined_memory, config.memory_recent_days, config.memory_max_entries
-        )
-        if filtered_memory.strip():
-            parts.append("## Relevant Memory")
-            parts.append("")
-            parts.append(filtered_memory)
-            parts.append("")
+    filtered_memory = _filter_recent_lines(
+        _iter_lines(memory_paths), config.memory_recent_days, config.memory_max_entries
+    )
+    if filtered_memory.strip():
+        parts += ["## Relevant Memory", "", filtered_memory, ""]
 
-    parts.append("---")
-    parts.append("*Generated by [Continuum](https://github.com/BioInfo/continuum)*")
+    parts += ["---", "*Generated by [Continuum](https://github.com/BioInfo/continuum)*"]
 
     return "\n".join(parts)
 
 
+def _read_optional(path: Path | None) -> str | None:
+    """Read a context file, or return None if there's no such file."""
+    if path is None:
+        return None
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
 def condense_content(content: str, max_words: int) -> str:
     """
     Condense content to approximately max_words.
 
     Tries to preserve structure by keeping headers and key sections.
+    Results are memoized on (content, max_words): identity.md rarely
+    changes between exports, and hashing the text is far cheaper than
+    walking it again.
     """
     lines = content.strip().split("\n")
     result_lines = []
     word_count = 0
 
     for line in lines:
-        line_words = len(line.split())
+        # Only count words up to one past the remaining budget: that's enough
+        # to tell whether the line fits, without splitting all of a long line
+        budget = max(max_words - word_count, 0)
+        line_words = len(line.split(None, budget))
 
         # Always include headers
         if line.startswith("#"):
@@ -130,57 +138,66 @@ def filter_recent_memory(content: str, days: int, max_entries: int) -> str:
 
     Returns entries from the last `days` days, or `max_entries`, whichever is more.
     """
-    lines = content.strip().split("\n")
+    return _filter_recent_lines(content.strip().split("\n"), days, max_entries)
+
+
+def _iter_lines(paths: list[Path]) -> Iterator[str]:
+    """Yield the lines of each existing file in turn."""
+    for path in paths:
+        try:
+            f = path.open()
+        except FileNotFoundError:
+            continue
+        with f:
+            yield from f
+
+
+def _filter_recent_lines(lines: Iterable[str], days: int, max_entries: int) -> str:
+    """Implement filter_recent_memory over memory lines from any source."""
     entries = []
     header_lines = []
     cutoff_date = datetime.now() - timedelta(days=days)
 
     in_header = True
     for line in lines:
+        stripped = line.strip()
+
         # Detect header section (before entries)
         if in_header:
-            if line.strip().startswith("[") and "]" in line:
+            if stripped.startswith("[") and "]" in stripped:
                 in_header = False
             else:
-                if line.strip() and not line.strip().startswith("---"):
+                if stripped and not stripped.startswith("---"):
                     header_lines.append(line)
                 continue
 
         # Parse entry
-        if line.strip().startswith("["):
-            try:
-                # Extract date from [YYYY-MM-DD] or [YYYY-MM] format
-                bracket_content = line[line.index("[") + 1 : line.index("]")]
-                date_str = bracket_content.strip()
-
-                # Parse various date formats
-                entry_date = None
-                for fmt in ["%Y-%m-%d", "%Y-%m"]:
-                    try:
-                        entry_date = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-
-                if entry_date:
-                    entries.append((entry_date, line.strip()))
-            except (ValueError, IndexError):
+        if stripped.startswith("["):
+            if "]" not in stripped:
                 # Include malformed entries at the end
-                entries.append((datetime.min, line.strip()))
-        elif line.strip():
+                entries.append((datetime.min, stripped))
+                continue
+
+            entry_date = _parse_entry_date(stripped)
+            if entry_date:
+                entries.append((entry_date, stripped))
+        elif stripped:
             # Continuation of previous entry or standalone line
             if entries:
                 date, text = entries[-1]
-                entries[-1] = (date, text + "\n" + line.strip())
+                entries[-1] = (date, text + "\n" + stripped)
 
-    # Sort by date descending
-    entries.sort(key=lambda x: x[0], reverse=True)
+    # Keep every entry within the date range, most recent first
+    recent = [entry for entry in entries if entry[0] >= cutoff_date]
+    recent.sort(key=lambda x: x[0], reverse=True)
 
-    # Filter: keep entries within date range OR up to max_entries
-    filtered = []
-    for date, text in entries:
-        if date >= cutoff_date or len(filtered) < max_entries:
-            filtered.append(text)
+    # Then top up to max_entries with the most recent older ones, selecting
+    # them with a bounded heap rather than sorting the whole backlog
+    if len(recent) < max_entries:
+        older = [entry for entry in entries if entry[0] < cutoff_date]
+        recent += heapq.nlargest(max_entries - len(recent), older, key=lambda x: x[0])
+
+    filtered = [text for _, text in recent]
 
     if not filtered:
         return ""
@@ -188,6 +205,22 @@ def filter_recent_memory(content: str, days: int, max_entries: int) -> str:
     return "\n".join(filtered)
 
 
+def _parse_entry_date(line: str) -> datetime | None:
+    """
+    Parse the [YYYY-MM-DD] or [YYYY-MM] date that opens a memory entry.
+
+    Returns None if the bracket doesn't hold a valid date.
+    """
+    match = _ENTRY_DATE_RE.match(line)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    try:
+        return datetime(int(year), int(month), int(day or 1))
+    except ValueError:
+        return None
+
+
 def write_export(config: Config, output_path: Path | None = None) -> Path:
     """Generate and write export to file."""
     content = generate_export(config)
@@ -1,14 +1,19 @@
 """File operations for Continuum."""
 
+import functools
 import importlib.resources
 import os
 import shutil
 import subprocess
-from datetime import datetime
+import time
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 from .config import Config, find_project_root
 
+# Source-tree template directory, used when package resources are unavailable
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
+
 
 def init_directory(base_path: Path, force: bool = False) -> list[str]:
     """
@@ -31,6 +36,7 @@ def init_directory(base_path: Path, force: bool = False) -> list[str]:
 
     # Copy templates
     templates = ["identity.md", "voice.md", "context.md", "memory.md", "config.yaml"]
+    today = today_str()
 
     for template_name in templates:
         dest = base_path / template_name
@@ -39,7 +45,7 @@ def init_directory(base_path: Path, force: bool = False) -> list[str]:
         else:
             content = load_template(template_name)
             # Replace placeholder date with today
-            content = content.replace("[Today's date]", datetime.now().strftime("%Y-%m-%d"))
+            content = content.replace("[Today's date]", today)
             dest.write_text(content)
             actions.append(f"Created {template_name}")
 
@@ -98,36 +104,41 @@ def init_project(project_root: Path | None = None, force: bool = False) -> list[
 """,
     }
 
+    today = today_str()
     for filename, content in project_templates.items():
         dest = continuum_dir / filename
         if dest.exists() and not force:
             actions.append(f"Skipped {filename} (exists)")
         else:
-            content = content.replace("[Today's date]", datetime.now().strftime("%Y-%m-%d"))
+            content = content.replace("[Today's date]", today)
             dest.write_text(content)
             actions.append(f"Created {filename}")
 
     # Add to .gitignore if it exists and .continuum not already ignored
+    # (read and append through one handle; reading leaves it at EOF)
     gitignore = project_root / ".gitignore"
-    if gitignore.exists():
-        gitignore_content = gitignore.read_text()
-        if ".continuum/" not in gitignore_content and ".continuum\n" not in gitignore_content:
-            with open(gitignore, "a") as f:
+    try:
+        with open(gitignore, "r+") as f:
+            gitignore_content = f.read()
+            if ".continuum/" not in gitignore_content and ".continuum\n" not in gitignore_content:
                 f.write("\n# Continuum local context\n.continuum/\n")
-            actions.append("Added .continuum/ to .gitignore")
+                actions.append("Added .continuum/ to .gitignore")
+    except FileNotFoundError:
+        pass
 
     return actions
 
 
+@functools.lru_cache(maxsize=16)
 def load_template(name: str) -> str:
-    """Load a template file from the package."""
+    """Load a template file from the package (cached; templates don't change)."""
     try:
         # Try to load from package resources
         files = importlib.resources.files("continuum") / "templates" / name
         return files.read_text()
     except Exception:
         # Fallback to relative path during development
-        template_path = Path(__file__).parent / "templates" / name
+        template_path = _TEMPLATES_DIR / name
         if template_path.exists():
             return template_path.read_text()
         raise FileNotFoundError(f"Template not found: {name}")
@@ -153,44 +164,75 @@ def open_in_editor(path: Path) -> bool:
         return False
 
 
-def get_file_age_str(path: Path) -> str:
-    """Get human-readable file age."""
-    if not path.exists():
-        return "missing"
+def scan_dir_stats(directory: Path | None) -> dict[str, os.stat_result]:
+    """
+    Stat every file in a directory with a single scandir pass.
+
+    Returns a mapping of file name to stat result, or an empty dict if the
+    directory is missing or unreadable.
+    """
+    stats: dict[str, os.stat_result] = {}
+    if directory is None:
+        return stats
 
-    mtime = datetime.fromtimestamp(path.stat().st_mtime)
-    age = datetime.now() - mtime
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stats[entry.name] = entry.stat()
+    except OSError:
+        pass
+    return stats
+
+
+def get_file_age_str(path: Path, st: os.stat_result | None = None) -> str:
+    """
+    Get human-readable file age.
 
-    if age.days == 0:
-        if age.seconds < 3600:
-            minutes = age.seconds // 60
+    Pass a stat result already fetched (e.g. from scan_dir_stats) as `st`
+    to skip the filesystem lookup.
+    """
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return "missing"
+
+    # Whole days plus leftover seconds, like timedelta.days / .seconds
+    days, seconds = divmod(int(time.time() - st.st_mtime), 86400)
+
+    if days == 0:
+        if seconds < 3600:
+            minutes = seconds // 60
             return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-        hours = age.seconds // 3600
+        hours = seconds // 3600
         return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif age.days == 1:
+    elif days == 1:
         return "1 day ago"
-    elif age.days < 7:
-        return f"{age.days} days ago"
-    elif age.days < 14:
+    elif days < 7:
+        return f"{days} days ago"
+    elif days < 14:
         return "1 week ago"
-    elif age.days < 30:
-        weeks = age.days // 7
+    elif days < 30:
+        weeks = days // 7
         return f"{weeks} weeks ago"
-    elif age.days < 60:
+    elif days < 60:
         return "1 month ago"
     else:
-        months = age.days // 30
+        months = days // 30
         return f"{months} months ago"
 
 
-def is_stale(path: Path, stale_days: int) -> bool:
+def is_stale(path: Path, stale_days: int, st: os.stat_result | None = None) -> bool:
     """Check if a file is stale (older than threshold)."""
-    if not path.exists():
-        return False
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
 
-    mtime = datetime.fromtimestamp(path.stat().st_mtime)
-    age = datetime.now() - mtime
-    return age.days > stale_days
+    # Whole days elapsed, compared directly against the epoch timestamp
+    return (time.time() - st.st_mtime) // 86400 > stale_days
 
 
 def count_memory_entries(path: Path) -> int:
@@ -198,17 +240,23 @@ def count_memory_entries(path: Path) -> int:
     if not path.exists():
         return 0
 
-    content = path.read_text()
-    # Count lines that start with [YYYY-MM-DD] or [YYYY-MM]
-    count = 0
-    for line in content.split("\n"):
-        line = line.strip()
-        if line.startswith("[") and "]" in line:
-            # Check if it looks like a date
-            bracket_content = line[1 : line.index("]")]
-            if "-" in bracket_content and len(bracket_content) >= 7:
-                count += 1
-    return count
+    with path.open() as f:
+        return sum(1 for line in f if is_dated_entry(line))
+
+
+def is_dated_entry(line: str) -> bool:
+    """Check whether a memory.md line starts with [YYYY-MM-DD] or [YYYY-MM]."""
+    line = line.lstrip()
+    if not line.startswith("["):
+        return False
+    end = line.find("]")
+    if end == -1:
+        return False
+    bracket_content = line[1:end]
+    return "-" in bracket_content and len(bracket_content) >= 7
+
+
+_FOCUS_HEADING = "## current focus"
 
 
 def extract_current_focus(path: Path) -> str | None:
@@ -216,35 +264,109 @@ def extract_current_focus(path: Path) -> str | None:
     if not path.exists():
         return None
 
-    content = path.read_text()
-
-    # Look for "## Current Focus" section
-    lines = content.split("\n")
+    # Return the first non-empty line of the "## Current Focus" section
     in_focus_section = False
-    focus_lines = []
-
-    for line in lines:
-        if line.strip().lower() == "## current focus":
-            in_focus_section = True
-            continue
-        elif line.startswith("## ") and in_focus_section:
-            break
-        elif in_focus_section and line.strip():
-            focus_lines.append(line.strip())
-
-    if focus_lines:
-        # Return first non-empty line, truncated
-        focus = focus_lines[0]
-        if len(focus) > 60:
-            focus = focus[:57] + "..."
-        return focus
+
+    with path.open() as f:
+        for line in f:
+            if not in_focus_section:
+                # Substring test first so ordinary lines don't allocate
+                in_focus_section = "##" in line and line.strip().lower() == _FOCUS_HEADING
+                continue
+            if line.startswith("## "):
+                break
+            focus = line.strip()
+            if focus:
+                # Truncate long focus lines
+                if len(focus) > 60:
+                    focus = focus[:57] + "..."
+                return focus
 
     return None
 
 
+# Memory entry categories, in the order shown to users
+MEMORY_CATEGORIES = ("fact", "decision", "lesson", "preference")
+
+# (expires_at, value) for today_str()
+_today_cache: tuple[float, str] = (0.0, "")
+
+
+def today_str() -> str:
+    """
+    Get today's local date as YYYY-MM-DD.
+
+    The string is cached until local midnight, so long-running callers like
+    the MCP server don't rebuild it for every entry.
+    """
+    global _today_cache
+
+    expires_at, value = _today_cache
+    now = time.time()
+    if now >= expires_at:
+        today = date.fromtimestamp(now)
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        value = today.isoformat()
+        _today_cache = (midnight.timestamp(), value)
+    return value
+
+
+# O_CLOEXEC is POSIX-only
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | _O_CLOEXEC
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_CLOEXEC
+
+
+def create_file(path: Path, content: bytes) -> bool:
+    """
+    Create a file with the given content unless it already exists.
+
+    The existence check and the create are one O_EXCL open, so there's no
+    window for another process to create the file in between. Returns True
+    if the file was created.
+    """
+    try:
+        fd = os.open(path, _CREATE_FLAGS, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+    return True
+
+
+def append_memory_entry(path: Path, entry: str) -> None:
+    """
+    Append an entry to a memory file on a new line.
+
+    Uses a single unbuffered O_APPEND write, so entries from concurrent
+    writers (CLI and MCP server) land whole rather than interleaved.
+    """
+    append_memory_entries(path, [entry])
+
+
+def append_memory_entries(path: Path, entries: list[str], fsync: bool = False) -> None:
+    """
+    Append several entries, each on a new line, in one O_APPEND write.
+
+    With fsync=True the write is flushed to disk before returning, so one
+    fsync covers the whole batch.
+    """
+    data = "".join(f"\n{entry}" for entry in entries).encode("utf-8")
+    fd = os.open(path, _APPEND_FLAGS)
+    try:
+        os.write(fd, data)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def get_last_export_time(exports_path: Path) -> datetime | None:
     """Get the timestamp of the last export."""
-    export_file = exports_path / "claude-code.md"
-    if export_file.exists():
-        return datetime.fromtimestamp(export_file.stat().st_mtime)
-    return None
+    try:
+        st = os.stat(exports_path / "claude-code.md")
+    except OSError:
+        return None
+    return datetime.fromtimestamp(st.st_mtime)
@@ -1,288 +1,486 @@
 """MCP Server for Continuum - expose context to Claude via MCP protocol."""
 
+import asyncio
+import functools
+import heapq
 import os
-from datetime import datetime
+import re
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from .config import Config
 from .export import generate_export
-from .files import count_memory_entries, extract_current_focus
+from .files import (
+    MEMORY_CATEGORIES,
+    append_memory_entries,
+    count_memory_entries,
+    extract_current_focus,
+    today_str,
+)
 
-# Create server instance
-server = Server("continuum")
+# A whole "[date] CATEGORY - text" memory entry line; captures the line and
+# its category word. Matched over a whole file, so no part may cross a newline.
+_ENTRY_RE = re.compile(r"^([^\S\n]*\[[^\]\n]*\][^\S\n]*([A-Za-z]*).*)$", re.MULTILINE)
+
+# Section headers for get_current_context
+_GLOBAL_CONTEXT_HEADER = "# Global Context\n"
+_PROJECT_CONTEXT_HEADER = "\n\n# Project Context\n"
 
 
 def get_config() -> Config:
     """Load config, optionally detecting project context."""
     project_path = os.environ.get("CONTINUUM_PROJECT_PATH")
     start_path = Path(project_path) if project_path else None
-    return Config.load(start_path=start_path)
-
-
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="get_context",
-            description="Get the user's full context including identity, voice, current context, and recent memories. Use this at the start of a conversation to understand who you're talking to.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="get_identity",
-            description="Get the user's identity information (name, role, background, values).",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="get_voice",
-            description="Get the user's voice and communication style guide. Use this when writing content as or for the user.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="get_current_context",
-            description="Get the user's current working context (active projects, focus areas, this week's priorities).",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="get_memories",
-            description="Get the user's memories (facts, decisions, lessons, preferences). Optionally filter by category or search term.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "Filter by category: fact, decision, lesson, preference",
-                        "enum": ["fact", "decision", "lesson", "preference"],
-                    },
-                    "search": {
-                        "type": "string",
-                        "description": "Search term to filter memories",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of memories to return (default: 20)",
-                        "default": 20,
-                    },
+    return Config.load_cached(start_path=start_path)
+
+
+# Tool definitions are static, so build them once at import
+_TOOLS = (
+    Tool(
+        name="get_context",
+        description="Get the user's full context including identity, voice, current context, and recent memories. Use this at the start of a conversation to understand who you're talking to.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_identity",
+        description="Get the user's identity information (name, role, background, values).",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_voice",
+        description="Get the user's voice and communication style guide. Use this when writing content as or for the user.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_current_context",
+        description="Get the user's current working context (active projects, focus areas, this week's priorities).",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_memories",
+        description="Get the user's memories (facts, decisions, lessons, preferences). Optionally filter by category or search term.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Filter by category: fact, decision, lesson, preference",
+                    "enum": list(MEMORY_CATEGORIES),
                 },
-                "required": [],
-            },
-        ),
-        Tool(
-            name="remember",
-            description="Save a new memory for the user. Use this to remember important facts, decisions, lessons learned, or preferences discovered during conversation.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "The memory to save",
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "Memory category",
-                        "enum": ["fact", "decision", "lesson", "preference"],
-                        "default": "fact",
-                    },
-                    "project": {
-                        "type": "boolean",
-                        "description": "Save to project memory instead of global (default: false)",
-                        "default": False,
-                    },
+                "search": {
+                    "type": "string",
+                    "description": "Search term to filter memories",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of memories to return (default: 20)",
+                    "default": 20,
                 },
-                "required": ["text"],
             },
-        ),
-        Tool(
-            name="get_status",
-            description="Get Continuum status including file ages, memory count, and current focus.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
+            "required": [],
+        },
+    ),
+    Tool(
+        name="remember",
+        description="Save a new memory for the user. Use this to remember important facts, decisions, lessons learned, or preferences discovered during conversation.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "The memory to save",
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Memory category",
+                    "enum": list(MEMORY_CATEGORIES),
+                    "default": "fact",
+                },
+                "project": {
+                    "type": "boolean",
+                    "description": "Save to project memory instead of global (default: false)",
+                    "default": False,
+                },
             },
-        ),
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="get_status",
+        description="Get Continuum status including file ages, memory count, and current focus.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+)
+
+
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    # Fresh list so callers can't mutate the shared tuple; Tools are reused
+    return list(_TOOLS)
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a context file as UTF-8, skipping the text-mode newline layer."""
+    return path.read_bytes().decode("utf-8")
+
+
+@dataclass(slots=True, frozen=True)
+class _MemoryEntry:
+    """One parsed memory line."""
+
+    text: str  # the stripped line
+    category: str  # upper-cased category word
+    lowered: str  # text.lower(), for search
+
+
+@dataclass(slots=True, frozen=True)
+class _MemoryIndex:
+    """The entries of one memory file, in file order and grouped by category."""
+
+    entries: list[_MemoryEntry]
+    by_category: dict[str, list[_MemoryEntry]]
+
+
+_EMPTY_INDEX = _MemoryIndex([], {})
+
+# Parsed memory files by path, with the (st_mtime_ns, st_size) they were read at
+_memory_cache: dict[Path, tuple[int, int, _MemoryIndex]] = {}
+
+
+def _parse_memory_file(path: Path) -> _MemoryIndex:
+    """
+    Read and parse every entry line of a memory file.
+
+    One finditer pass over the whole text finds the entry lines, so the
+    headers and blank lines between them never reach Python code.
+    """
+    entries = []
+    by_category: dict[str, list[_MemoryEntry]] = {}
+    with path.open() as f:
+        content = f.read()
+    for m in _ENTRY_RE.finditer(content):
+        text = m.group(1).strip()
+        # Interned: every entry of a category shares one string
+        entry = _MemoryEntry(text, sys.intern(m.group(2).upper()), text.lower())
+        entries.append(entry)
+        by_category.setdefault(entry.category, []).append(entry)
+    return _MemoryIndex(entries, by_category)
+
+
+def _load_memories(path: Path) -> _MemoryIndex:
+    """
+    Return the parsed entries of a memory file, empty if it doesn't exist.
+
+    Files are only re-read when their mtime or size has changed since the
+    last call, so repeated get_memories calls skip the read and the parse.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _memory_cache.pop(path, None)
+        return _EMPTY_INDEX
+
+    cached = _memory_cache.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    try:
+        index = _parse_memory_file(path)
+    except FileNotFoundError:
+        return _EMPTY_INDEX
+    _memory_cache[path] = (st.st_mtime_ns, st.st_size, index)
+    return index
+
+
+def _iter_memories(paths: list[Path], category: str | None, search: str) -> Iterator[str]:
+    """Yield memory lines from paths that match the category and search filters."""
+    category = category.upper() if category else None
+
+    for mem_path in paths:
+        index = _load_memories(mem_path)
+        # Filter by category if specified: a dict lookup, not a scan
+        entries = index.by_category.get(category, ()) if category else index.entries
+        for entry in entries:
+            # Filter by search term if specified
+            if search and search not in entry.lowered:
+                continue
+            yield entry.text
+
+
+def _status_text(config: Config) -> str:
+    """Render the get_status report (blocking file I/O)."""
+    parts = []
+
+    # Global status
+    parts.append(f"Continuum: {config.base_path}")
+    parts.append("")
+
+    files = [
+        ("identity.md", config.identity_path),
+        ("voice.md", config.voice_path),
+        ("context.md", config.context_path),
+        ("memory.md", config.memory_path),
     ]
 
+    now = time.time()
+    for filename, path in files:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            parts.append(f"  {filename}: missing")
+            continue
+        parts.append(f"  {filename}: {int((now - mtime) // 86400)}d old")
+
+    # Memory count
+    mem_count = count_memory_entries(config.memory_path)
+    parts.append(f"\nMemories: {mem_count} entries")
+
+    # Current focus
+    focus = extract_current_focus(config.context_path)
+    if focus:
+        parts.append(f"Focus: {focus}")
+
+    # Project status
+    if config.has_project:
+        parts.append(f"\nProject: {config.project_path}")
+        if config.project_context_path:
+            project_focus = extract_current_focus(config.project_context_path)
+            if project_focus:
+                parts.append(f"Project focus: {project_focus}")
+
+    return "\n".join(parts)
+
+
+class _MemoryAppendBatcher:
+    """
+    Group-commit appends to memory files.
+
+    Each caller waits until its own entry is on disk (written and fsynced),
+    but entries queued while a write is in flight are coalesced into the
+    next one, so a burst of remember calls costs one open/write/fsync/close
+    per file rather than one per entry.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Path, list[tuple[str, asyncio.Future]]] = {}
+        self._flusher: asyncio.Task | None = None
+
+    async def append(self, path: Path, entry: str) -> None:
+        # Reject unencodable text (e.g. lone surrogates) here, so it fails
+        # only this caller rather than the whole batch it would join
+        entry.encode("utf-8")
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        self._pending.setdefault(path, []).append((entry, done))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush())
+        await done
+
+    async def _flush(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending, {}
+            for path, items in batch.items():
+                try:
+                    await asyncio.to_thread(
+                        append_memory_entries, path, [e for e, _ in items], fsync=True
+                    )
+                except asyncio.CancelledError:
+                    # Don't leave any caller waiting on a flush that won't happen
+                    for waiting in (*batch.values(), *self._pending.values()):
+                        for _, done in waiting:
+                            done.cancel()
+                    self._pending = {}
+                    raise
+                except Exception as exc:
+                    # Fail this file's callers; other files in the batch go on
+                    for _, done in items:
+                        if not done.done():
+                            done.set_exception(exc)
+                else:
+                    # Don't wait for the mtime to tick over; reparse next read
+                    _memory_cache.pop(path, None)
+                    for _, done in items:
+                        if not done.done():
+                            done.set_result(None)
+
+
+_memory_writer = _MemoryAppendBatcher()
+
+
+async def _get_context(config: Config, arguments: dict) -> list[TextContent]:
+    content = await asyncio.to_thread(generate_export, config)
+    return [TextContent(type="text", text=content)]
+
+
+async def _get_identity(config: Config, arguments: dict) -> list[TextContent]:
+    if config.identity_path.exists():
+        content = await asyncio.to_thread(_read_utf8, config.identity_path)
+        return [TextContent(type="text", text=content)]
+    return [TextContent(type="text", text="Identity not configured. Run `continuum init` to set up.")]
+
+
+async def _get_voice(config: Config, arguments: dict) -> list[TextContent]:
+    # Project voice first, then global
+    voice_path = config.get_effective_path("voice")
+    if voice_path:
+        content = await asyncio.to_thread(_read_utf8, voice_path)
+        return [TextContent(type="text", text=content)]
+    return [TextContent(type="text", text="Voice profile not configured.")]
+
+
+async def _get_current_context(config: Config, arguments: dict) -> list[TextContent]:
+    parts = []
+
+    # Global context
+    if config.context_path.exists():
+        parts.append(_GLOBAL_CONTEXT_HEADER)
+        parts.append(await asyncio.to_thread(_read_utf8, config.context_path))
+
+    # Project context
+    if config.project_context_path:
+        parts.append(_PROJECT_CONTEXT_HEADER)
+        parts.append(await asyncio.to_thread(_read_utf8, config.project_context_path))
+
+    if parts:
+        return [TextContent(type="text", text="".join(parts))]
+    return [TextContent(type="text", text="No context configured.")]
+
+
+async def _get_memories(config: Config, arguments: dict) -> list[TextContent]:
+    category = arguments.get("category")
+    search = arguments.get("search", "").lower()
+    limit = arguments.get("limit", 20)
+
+    # Collect from global and project memory
+    memory_paths = [config.memory_path]
+    if config.project_memory_path:
+        memory_paths.append(config.project_memory_path)
+
+    # Most recent first; lines start with an ISO date so they sort as text.
+    # The scan runs in a worker thread so it doesn't block other sessions.
+    memories = await asyncio.to_thread(
+        heapq.nlargest, limit, _iter_memories(memory_paths, category, search)
+    )
+
+    if memories:
+        return [TextContent(type="text", text="\n".join(memories))]
+    return [TextContent(type="text", text="No memories found matching criteria.")]
+
+
+async def _remember(config: Config, arguments: dict) -> list[TextContent]:
+    text = arguments.get("text", "")
+    category = arguments.get("category", "fact")
+    use_project = arguments.get("project", False)
+
+    if not text:
+        return [TextContent(type="text", text="Error: text is required")]
+
+    # Determine target memory file
+    if use_project and config.has_project:
+        memory_path = config.project_path / "memory.md"
+        location = "project memory"
+    else:
+        memory_path = config.memory_path
+        location = "global memory"
+
+    if not memory_path.exists():
+        return [TextContent(type="text", text=f"Error: {memory_path} not found. Run `continuum init` first.")]
+
+    # Format and append entry
+    date = today_str()
+    entry = f"[{date}] {category.upper()} - {text}"
+
+    await _memory_writer.append(memory_path, entry)
+
+    return [TextContent(type="text", text=f"Saved to {location}: {entry}")]
+
+
+async def _get_status(config: Config, arguments: dict) -> list[TextContent]:
+    text = await asyncio.to_thread(_status_text, config)
+    return [TextContent(type="text", text=text)]
+
+
+# Tool name -> handler(config, arguments)
+_HANDLERS: dict[str, Callable[[Config, dict], Awaitable[list[TextContent]]]] = {
+    "get_context": _get_context,
+    "get_identity": _get_identity,
+    "get_voice": _get_voice,
+    "get_current_context": _get_current_context,
+    "get_memories": _get_memories,
+    "remember": _remember,
+    "get_status": _get_status,
+}
+
 
-@server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls."""
-    config = get_config()
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(get_config(), arguments)
 
-    if name == "get_context":
-        content = generate_export(config)
-        return [TextContent(type="text", text=content)]
 
-    elif name == "get_identity":
-        if config.identity_path.exists():
-            content = config.identity_path.read_text()
-            return [TextContent(type="text", text=content)]
-        return [TextContent(type="text", text="Identity not configured. Run `continuum init` to set up.")]
-
-    elif name == "get_voice":
-        # Check project voice first, then global
-        voice_path = config.project_voice_path or (
-            config.voice_path if config.voice_path.exists() else None
-        )
-        if voice_path:
-            content = voice_path.read_text()
-            return [TextContent(type="text", text=content)]
-        return [TextContent(type="text", text="Voice profile not configured.")]
-
-    elif name == "get_current_context":
-        parts = []
-
-        # Global context
-        if config.context_path.exists():
-            parts.append("# Global Context\n")
-            parts.append(config.context_path.read_text())
-
-        # Project context
-        if config.project_context_path:
-            parts.append("\n\n# Project Context\n")
-            parts.append(config.project_context_path.read_text())
-
-        if parts:
-            return [TextContent(type="text", text="".join(parts))]
-        return [TextContent(type="text", text="No context configured.")]
-
-    elif name == "get_memories":
-        category = arguments.get("category")
-        search = arguments.get("search", "").lower()
-        limit = arguments.get("limit", 20)
-
-        memories = []
-
-        # Collect from global and project memory
-        memory_paths = [config.memory_path]
-        if config.project_memory_path:
-            memory_paths.append(config.project_memory_path)
-
-        for mem_path in memory_paths:
-            if mem_path.exists():
-                content = mem_path.read_text()
-                for line in content.split("\n"):
-                    line = line.strip()
-                    if line.startswith("[") and "]" in line:
-                        # Filter by category if specified
-                        if category:
-                            if f"] {category.upper()}" not in line.upper():
-                                continue
-                        # Filter by search term if specified
-                        if search and search not in line.lower():
-                            continue
-                        memories.append(line)
-
-        # Sort by date (most recent first) and limit
-        memories.sort(reverse=True)
-        memories = memories[:limit]
-
-        if memories:
-            return [TextContent(type="text", text="\n".join(memories))]
-        return [TextContent(type="text", text="No memories found matching criteria.")]
-
-    elif name == "remember":
-        text = arguments.get("text", "")
-        category = arguments.get("category", "fact")
-        use_project = arguments.get("project", False)
-
-        if not text:
-            return [TextContent(type="text", text="Error: text is required")]
-
-        # Determine target memory file
-        if use_project and config.has_project:
-            memory_path = config.project_path / "memory.md"
-            location = "project memory"
-        else:
-            memory_path = config.memory_path
-            location = "global memory"
-
-        if not memory_path.exists():
-            return [TextContent(type="text", text=f"Error: {memory_path} not found. Run `continuum init` first.")]
-
-        # Format and append entry
-        date = datetime.now().strftime("%Y-%m-%d")
-        entry = f"[{date}] {category.upper()} - {text}"
-
-        with open(memory_path, "a") as f:
-            f.write(f"\n{entry}")
-
-        return [TextContent(type="text", text=f"Saved to {location}: {entry}")]
-
-    elif name == "get_status":
-        parts = []
-
-        # Global status
-        parts.append(f"Continuum: {config.base_path}")
-        parts.append("")
-
-        files = [
-            ("identity.md", config.identity_path),
-            ("voice.md", config.voice_path),
-            ("context.md", config.context_path),
-            ("memory.md", config.memory_path),
-        ]
-
-        for name, path in files:
-            if path.exists():
-                mtime = datetime.fromtimestamp(path.stat().st_mtime)
-                age = datetime.now() - mtime
-                parts.append(f"  {name}: {age.days}d old")
-            else:
-                parts.append(f"  {name}: missing")
-
-        # Memory count
-        mem_count = count_memory_entries(config.memory_path)
-        parts.append(f"\nMemories: {mem_count} entries")
-
-        # Current focus
-        focus = extract_current_focus(config.context_path)
-        if focus:
-            parts.append(f"Focus: {focus}")
-
-        # Project status
-        if config.has_project:
-            parts.append(f"\nProject: {config.project_path}")
-            if config.project_context_path:
-                project_focus = extract_current_focus(config.project_context_path)
-                if project_focus:
-                    parts.append(f"Project focus: {project_focus}")
-
-        return [TextContent(type="text", text="\n".join(parts))]
-
-    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+@functools.lru_cache(maxsize=None)
+def get_server() -> Server:
+    """Create the MCP server and register the tool handlers, once, on first use."""
+    server = Server("continuum")
+    server.list_tools()(list_tools)
+    server.call_tool()(call_tool)
+    return server
+
+
+def __getattr__(name: str):
+    # `server` used to be built at import time; keep it importable
+    if name == "server":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def main_stdio():
     """Run the MCP server with stdio transport (for local use)."""
+    from mcp.server.stdio import stdio_server
+
+    server = get_server()
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
 
 def run_stdio():
     """Entry point for stdio server (local Claude Code/Desktop)."""
-    import asyncio
-    asyncio.run(main_stdio())
+    # Prefer uvloop's faster event loop when the optional extra is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main_stdio())
+    else:
+        uvloop.run(main_stdio())
 
 
 def run_sse(host: str = "0.0.0.0", port: int = 8765):
@@ -299,6 +497,8 @@ def run_sse(host: str = "0.0.0.0", port: int = 8765):
     from starlette.responses import JSONResponse
     import uvicorn
 
+    server = get_server()
+
     # Create SSE transport - messages endpoint relative to where SSE is served
     sse = SseServerTransport("/messages")
 
@@ -352,7 +552,7 @@ def run_http(host: str = "0.0.0.0", port: int = 8765):
     from starlette.responses import JSONResponse
     import uvicorn
 
-    session_manager = StreamableHTTPSessionManager(app=server, stateless=True)
+    session_manager = StreamableHTTPSessionManager(app=get_server(), stateless=True)
 
     async def health_check(request):
         return JSONResponse({"status": "ok", "server": "continuum-mcp", "transport": "streamable-http"})
@@ -0,0 +1,156 @@
+"""MCP server commands for the Continuum CLI.
+
+Loaded on demand by the top-level ``cli`` group; the MCP server and its
+transports are imported only inside the command that runs them.
+"""
+
+import functools
+import shutil
+import sys
+from pathlib import Path
+
+import click
+
+from .cli import console
+
+
+@click.group()
+def serve():
+    """MCP server commands."""
+    pass
+
+
+@serve.command("stdio")
+def serve_stdio():
+    """Run MCP server with stdio transport (for local Claude Code/Desktop)."""
+    from .mcp_server import run_stdio
+
+    console().print("[bold]Starting Continuum MCP server (stdio)...[/bold]")
+    run_stdio()
+
+
+@serve.command("http")
+@click.option("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0 for Tailscale)")
+@click.option("--port", default=8765, help="Port to listen on (default: 8765)")
+def serve_http(host: str, port: int):
+    """Run MCP server with Streamable HTTP transport (recommended for remote access).
+
+    This starts an HTTP server that Claude can connect to remotely.
+    Use with Tailscale for secure access from any device.
+
+    Example:
+        continuum serve http
+        continuum serve http --port 9000
+    """
+    from .mcp_server import run_http
+
+    console().print(f"[bold]Starting Continuum MCP server (Streamable HTTP)...[/bold]")
+    console().print(f"  Host: {host}")
+    console().print(f"  Port: {port}")
+    console().print()
+    run_http(host=host, port=port)
+
+
+@serve.command("sse")
+@click.option("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0 for Tailscale)")
+@click.option("--port", default=8765, help="Port to listen on (default: 8765)")
+def serve_sse(host: str, port: int):
+    """Run MCP server with SSE transport (legacy, use 'serve http' instead).
+
+    This starts an HTTP server that Claude can connect to remotely.
+    Use with Tailscale for secure access from any device.
+
+    Example:
+        continuum serve sse
+        continuum serve sse --port 9000
+    """
+    from .mcp_server import run_sse
+
+    console().print(f"[bold]Starting Continuum MCP server (SSE)...[/bold]")
+    console().print(f"  [yellow]Note: SSE is legacy. Consider 'continuum serve http' instead.[/yellow]")
+    console().print(f"  Host: {host}")
+    console().print(f"  Port: {port}")
+    console().print()
+    run_sse(host=host, port=port)
+
+
+@functools.lru_cache(maxsize=None)
+def find_mcp_executable() -> str:
+    """
+    Locate the continuum-mcp entry point.
+
+    It is installed next to the interpreter running this CLI, so check there
+    before falling back to a PATH search.
+    """
+    candidate = Path(sys.executable).with_name("continuum-mcp")
+    if candidate.is_file():
+        return str(candidate)
+    return shutil.which("continuum-mcp") or "continuum-mcp"
+
+
+# MCP client config snippets, laid out as json.dumps(..., indent=2) would.
+# Only the string values vary, and they are JSON-escaped when filled in.
+_STDIO_CONFIG_TEMPLATE = """{{
+  "continuum": {{
+    "command": {command},
+    "args": []
+  }}
+}}"""
+
+_REMOTE_CONFIG_TEMPLATE = """{{
+  "continuum": {{
+    "transport": "{transport}",
+    "url": {url}
+  }}
+}}"""
+
+
+@serve.command("config")
+@click.option("--sse", is_flag=True, help="Show legacy SSE config instead of Streamable HTTP")
+@click.option("--http", "use_http", is_flag=True, help="Show Streamable HTTP config (default for remote)")
+@click.option("--port", default=8765, help="Port for remote server")
+def serve_config(sse: bool, use_http: bool, port: int):
+    """Show MCP configuration for Claude Code or Claude Desktop.
+
+    Without flags: shows stdio config (local).
+    With --http: shows Streamable HTTP config (recommended for remote).
+    With --sse: shows legacy SSE config (for older clients).
+    """
+    import json
+    import subprocess
+
+    if sse or use_http:
+        # Get Tailscale hostname. Only our own node is needed, so leave peers
+        # out of the output; json.loads takes the raw bytes directly.
+        try:
+            result = subprocess.run(
+                ["tailscale", "status", "--json", "--peers=false"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+            ts_status = json.loads(result.stdout)
+            hostname = ts_status.get("Self", {}).get("DNSName", "").rstrip(".")
+            if not hostname:
+                hostname = "<your-tailscale-hostname>"
+        except Exception:
+            hostname = "<your-tailscale-hostname>"
+
+        if sse:
+            config = _REMOTE_CONFIG_TEMPLATE.format(
+                transport="sse", url=json.dumps(f"https://{hostname}/mcp/sse")
+            )
+            console().print("[bold]SSE MCP Config (legacy, for remote Claude):[/bold]")
+        else:
+            config = _REMOTE_CONFIG_TEMPLATE.format(
+                transport="http", url=json.dumps(f"https://{hostname}/mcp")
+            )
+            console().print("[bold]Streamable HTTP MCP Config (for remote Claude):[/bold]")
+    else:
+        config = _STDIO_CONFIG_TEMPLATE.format(command=json.dumps(find_mcp_executable()))
+        console().print("[bold]Stdio MCP Config (for local Claude Code):[/bold]")
+
+    console().print()
+    console().print(config)
+    console().print()
+    console().print("[dim]Add this to your MCP settings file.[/dim]")
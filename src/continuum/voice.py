@@ -1,14 +1,35 @@
 """Voice analysis using LLM."""
 
+import ast
+import asyncio
+import functools
+import hashlib
+import importlib.util
 import json
 import os
-from dataclasses import dataclass
+import random
+import re
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-
-import httpx
+from typing import TYPE_CHECKING
 
 from .config import Config
 
+# httpx is imported where requests are made, so importing this module (e.g.
+# for generate_voice_md) doesn't pull in the HTTP stack
+if TYPE_CHECKING:
+    import httpx
+
+# orjson (optional "fast" extra) decodes the analysis JSON several times faster;
+# its JSONDecodeError subclasses ValueError like the stdlib one
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Analysis prompt that extracts voice patterns
 ANALYSIS_PROMPT = """You are an expert communication analyst. Analyze the following writing samples and extract a comprehensive voice profile.
 
@@ -73,71 +94,269 @@ Be specific and grounded in the actual samples. Use exact phrases from the sampl
 
 ---
 
-WRITING SAMPLES:
+WRITING SAMPLES (grouped by category; each sample starts with a "--- Sample N ---" line):
 
 """
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VoiceAnalysisResult:
     """Result of voice analysis."""
 
     raw_response: str
     parsed: dict | None
     error: str | None = None
+    sample_count: int = 0
+    cached: bool = False  # served from the on-disk analysis cache
+    timings: dict[str, float] = field(default_factory=dict)  # seconds per phase
+
+
+_SAMPLE_SUFFIXES = frozenset({".md", ".txt", ".eml", ""})
+
+
+def _read_sample(path: str) -> str:
+    """Read one sample file, treating unreadable files as empty."""
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", errors="ignore")
+    except Exception:
+        return ""
+
+
+def _is_sample_file(entry: os.DirEntry) -> bool:
+    """Check for a non-empty, non-hidden regular file with a sample extension."""
+    try:
+        return (
+            not entry.name.startswith(".")
+            and entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in _SAMPLE_SUFFIXES
+            and entry.stat().st_size > 0
+        )
+    except OSError:
+        return False
 
 
 def collect_samples(samples_path: Path) -> dict[str, list[str]]:
     """
     Collect writing samples from the samples directory.
 
-    Returns dict mapping category to list of sample contents.
+    Returns dict mapping category to list of sample contents. Files are
+    read on a thread pool, since on a cold cache or network filesystem
+    the time goes to waiting on each read.
     """
     samples = {}
 
-    if not samples_path.exists():
+    # Walk first, recording (category, path) for every candidate file
+    files: list[tuple[str, str]] = []
+    try:
+        with os.scandir(samples_path) as it:
+            entries = list(it)
+    except OSError:
         return samples
 
-    # Check for category subdirectories
-    for item in samples_path.iterdir():
+    for item in entries:
+        # Skip .git, .DS_Store and other hidden entries
+        if item.name.startswith("."):
+            continue
         if item.is_dir():
             category = item.name
             samples[category] = []
-            for file in item.glob("*"):
-                if file.is_file() and file.suffix in (".md", ".txt", ".eml", ""):
-                    try:
-                        content = file.read_text(errors="ignore")
-                        if content.strip():
-                            samples[category].append(content)
-                    except Exception:
-                        pass
-        elif item.is_file() and item.suffix in (".md", ".txt", ".eml", ""):
-            # Files directly in samples/ go to "general"
-            if "general" not in samples:
-                samples["general"] = []
             try:
-                content = item.read_text(errors="ignore")
-                if content.strip():
-                    samples["general"].append(content)
-            except Exception:
+                with os.scandir(item.path) as category_entries:
+                    for file in category_entries:
+                        if _is_sample_file(file):
+                            files.append((category, file.path))
+            except OSError:
                 pass
+        elif _is_sample_file(item):
+            # Files directly in samples/ go to "general"
+            samples.setdefault("general", [])
+            files.append(("general", item.path))
+
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+            contents = list(pool.map(_read_sample, [path for _, path in files]))
+    else:
+        contents = [_read_sample(path) for _, path in files]
+
+    # Forwarded mail and template replies often appear more than once;
+    # keep only the first copy of each body, across all categories
+    seen: set[bytes] = set()
+    for (category, _), content in zip(files, contents):
+        if not content.strip():
+            continue
+        digest = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+        if digest in seen:
+            continue
+        seen.add(digest)
+        samples[category].append(content)
 
     return samples
 
 
-def build_prompt(samples: dict[str, list[str]]) -> str:
-    """Build the full analysis prompt with samples."""
-    prompt = ANALYSIS_PROMPT
+# Per-sample cap, and the budget shared by all samples in one prompt
+# (~100k tokens); with many samples each one's share shrinks below the cap
+MAX_SAMPLE_CHARS = 5000
+MAX_TOTAL_SAMPLE_CHARS = 400_000
+
+
+def build_prompt(
+    samples: dict[str, list[str]], max_total_chars: int = MAX_TOTAL_SAMPLE_CHARS
+) -> str:
+    """
+    Build the full analysis prompt with samples.
+
+    Each sample is truncated to MAX_SAMPLE_CHARS, or to an equal share of
+    max_total_chars if that is smaller, so the prompt stays within budget
+    however many samples there are. Samples are separated by one-line
+    markers rather than code fences, which cost several tokens apiece.
+    """
+    total_samples = sum(len(contents) for contents in samples.values())
+    limit = min(MAX_SAMPLE_CHARS, max_total_chars // max(total_samples, 1))
+
+    parts = [ANALYSIS_PROMPT]
 
     for category, contents in samples.items():
-        prompt += f"\n## {category.upper()} SAMPLES\n\n"
+        parts.append(f"\n## {category.upper()} SAMPLES\n\n")
         for i, content in enumerate(contents, 1):
             # Truncate very long samples
-            if len(content) > 5000:
-                content = content[:5000] + "\n[... truncated ...]"
-            prompt += f"### Sample {i}\n```\n{content}\n```\n\n"
+            if len(content) > limit:
+                content = content[:limit] + "\n[... truncated ...]"
+            parts.append(f"\n--- Sample {i} ---\n{content}\n")
+
+    return "".join(parts)
+
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# HTTP/2 lets concurrent requests share one connection; needs the h2 package
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+# Providers that take explicit cache_control breakpoints through OpenRouter
+# (OpenAI models cache long prefixes automatically and need no hint)
+_CACHE_CONTROL_PREFIXES = ("anthropic/", "google/")
+
+
+def _message_content(prompt: str, model: str) -> str | list[dict]:
+    """
+    Build the user message content, marking cacheable parts where supported.
+
+    Prompts from build_prompt() start with the static ANALYSIS_PROMPT. For
+    providers that honour cache_control, that prefix and the full prompt
+    become separate ephemeral cache breakpoints: the first is shared by every
+    run, the second lets an identical re-run (say, after --dry-run) reuse
+    the whole prompt. Providers ignore breakpoints below their minimum size.
+    """
+    if not model.startswith(_CACHE_CONTROL_PREFIXES) or not prompt.startswith(ANALYSIS_PROMPT):
+        return prompt
+
+    ephemeral = {"type": "ephemeral"}
+    return [
+        {"type": "text", "text": ANALYSIS_PROMPT, "cache_control": ephemeral},
+        {"type": "text", "text": prompt[len(ANALYSIS_PROMPT) :], "cache_control": ephemeral},
+    ]
+
+
+def _openrouter_request(prompt: str, api_key: str, model: str, max_tokens: int) -> dict:
+    """Build the keyword arguments for an OpenRouter chat completion POST."""
+    return {
+        "headers": {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/BioInfo/continuum",
+            "X-Title": "Continuum Voice Analysis",
+        },
+        "json": {
+            "model": model,
+            "messages": [{"role": "user", "content": _message_content(prompt, model)}],
+            "max_tokens": max_tokens,
+            "temperature": 0.3,  # Lower temperature for more consistent analysis
+        },
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _sync_client() -> "httpx.Client":
+    """Process-wide client, so repeated calls reuse the TLS connection."""
+    import httpx
+
+    return httpx.Client(
+        http2=_HTTP2,
+        timeout=120.0,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+    )
+
+
+# Transient statuses worth retrying, and the retry budget per call
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+_RETRY_DEADLINE = 300.0  # seconds, across all attempts
+
+
+def _retry_delay(response: "httpx.Response", attempt: int, deadline: float) -> float | None:
+    """
+    Seconds to wait before retrying, or None if the response is final.
+
+    Honours a numeric Retry-After header, otherwise backs off exponentially
+    with jitter. Gives up after _MAX_ATTEMPTS or when the wait would run
+    past the deadline.
+    """
+    if response.status_code not in _RETRY_STATUSES or attempt + 1 >= _MAX_ATTEMPTS:
+        return None
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 2**attempt + random.random()
+    delay = min(60.0, max(0.0, delay))
+    if time.monotonic() + delay > deadline:
+        return None
+    return delay
+
+
+# Characters that can change JSON nesting or string state
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+
+
+class _JsonObjectTracker:
+    """
+    Follow streamed text until the first top-level JSON object closes.
+
+    Text before the first "{" (prose, a ```json fence) is ignored. Only
+    braces, quotes and backslashes are visited, so the scan jumps through
+    each chunk rather than walking every character.
+    """
 
-    return prompt
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escape_next = False  # last chunk ended with a backslash
+        self.end = -1  # offset just past the closing brace, in the last chunk fed
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk; return True once the outer object is complete."""
+        escaped = 0 if self.escape_next else -1
+        self.escape_next = False
+
+        for match in _JSON_STRUCTURAL_RE.finditer(text):
+            i = match.start()
+            char = text[i]
+            if i == escaped or (self.depth == 0 and char != "{"):
+                continue
+            if char == "\\":
+                if self.in_string:
+                    if i + 1 == len(text):
+                        self.escape_next = True
+                    else:
+                        escaped = i + 1
+            elif char == '"':
+                self.in_string = not self.in_string
+            elif not self.in_string:
+                self.depth += 1 if char == "{" else -1
+                if self.depth == 0:
+                    self.end = i + 1
+                    return True
+        return False
 
 
 def call_openrouter(
@@ -145,242 +364,335 @@ def call_openrouter(
     api_key: str,
     model: str = "google/gemini-3-flash-preview",
     max_tokens: int = 8000,
+    stream: bool = False,
 ) -> str:
-    """Call OpenRouter API with the analysis prompt."""
-    url = "https://openrouter.ai/api/v1/chat/completions"
-
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://github.com/BioInfo/continuum",
-        "X-Title": "Continuum Voice Analysis",
-    }
+    """
+    Call OpenRouter API with the analysis prompt.
 
-    payload = {
-        "model": model,
-        "messages": [{"role": "user", "content": prompt}],
-        "max_tokens": max_tokens,
-        "temperature": 0.3,  # Lower temperature for more consistent analysis
-    }
+    With stream=True the completion is read as server-sent events and the
+    request is closed as soon as the response's JSON object is complete,
+    skipping whatever the model would write after it.
+    """
+    request = _openrouter_request(prompt, api_key, model, max_tokens)
+    if stream:
+        return _stream_openrouter(request)
+
+    deadline = time.monotonic() + _RETRY_DEADLINE
+    for attempt in range(_MAX_ATTEMPTS):
+        response = _sync_client().post(OPENROUTER_URL, **request)
+        delay = _retry_delay(response, attempt, deadline)
+        if delay is None:
+            break
+        time.sleep(delay)
 
-    with httpx.Client(timeout=120.0) as client:
-        response = client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        data = response.json()
+    response.raise_for_status()
+    data = response.json()
 
     return data["choices"][0]["message"]["content"]
 
 
+def _stream_openrouter(request: dict) -> str:
+    """Stream a completion, retrying transient errors before it starts."""
+    request["json"]["stream"] = True
+
+    deadline = time.monotonic() + _RETRY_DEADLINE
+    for attempt in range(_MAX_ATTEMPTS):
+        with _sync_client().stream("POST", OPENROUTER_URL, **request) as response:
+            delay = _retry_delay(response, attempt, deadline)
+            if delay is None:
+                if response.is_success:
+                    return _read_stream(response)
+                # Read the error body while the stream is open, so the
+                # HTTPStatusError below can report it
+                response.read()
+                break
+        time.sleep(delay)
+
+    response.raise_for_status()
+
+
+def _read_stream(response: "httpx.Response") -> str:
+    """Collect streamed content, stopping once its JSON object has closed."""
+    parts = []
+    tracker = _JsonObjectTracker()
+
+    for line in response.iter_lines():
+        # Skip blank separators and ": keep-alive" comments
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        event = _json_loads(data)
+        if "error" in event:
+            error = event["error"]
+            message = error.get("message", "stream error") if isinstance(error, dict) else error
+            raise RuntimeError(str(message))
+        # Usage and keep-alive frames from some providers have no choices
+        choices = event.get("choices") or ()
+        if not choices:
+            continue
+        delta = (choices[0].get("delta") or {}).get("content")
+        if delta:
+            parts.append(delta)
+            if tracker.feed(delta):
+                break
+
+    return "".join(parts)
+
+
+async def call_openrouter_async(
+    prompt: str,
+    api_key: str,
+    model: str = "google/gemini-3-flash-preview",
+    max_tokens: int = 8000,
+    client: "httpx.AsyncClient | None" = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> str:
+    """
+    Async variant of call_openrouter().
+
+    Pass a shared client to run several requests over the same connection
+    pool; otherwise a client is created for this call. A shared semaphore
+    caps how many requests are in flight at once. Transient errors (429,
+    5xx) are retried with backoff, as in call_openrouter().
+    """
+    if client is None:
+        import httpx
+
+        async with httpx.AsyncClient(timeout=120.0, http2=_HTTP2) as client:
+            return await call_openrouter_async(
+                prompt, api_key, model, max_tokens, client, semaphore
+            )
+
+    request = _openrouter_request(prompt, api_key, model, max_tokens)
+    deadline = time.monotonic() + _RETRY_DEADLINE
+    for attempt in range(_MAX_ATTEMPTS):
+        # Hold the semaphore only while a request is in flight, not while
+        # backing off, so one throttled call doesn't stall the others
+        if semaphore is None:
+            response = await client.post(OPENROUTER_URL, **request)
+        else:
+            async with semaphore:
+                response = await client.post(OPENROUTER_URL, **request)
+        delay = _retry_delay(response, attempt, deadline)
+        if delay is None:
+            break
+        await asyncio.sleep(delay)
+
+    response.raise_for_status()
+    data = response.json()
+
+    return data["choices"][0]["message"]["content"]
+
+
+# A JSON string literal, honouring escapes; an unterminated one runs to the end
+_JSON_STRING_RE = re.compile(r'"(?:\\.|[^"\\])*"?', re.DOTALL)
+_NEWLINES_TO_SPACES = str.maketrans("\n\r", "  ")
+
+
 def fix_broken_json_strings(json_str: str) -> str:
     """Fix JSON that has line breaks inside string values."""
-    import re
-
-    # Find all strings and fix newlines within them
-    result = []
-    in_string = False
-    escape_next = False
-    i = 0
-
-    while i < len(json_str):
-        char = json_str[i]
-
-        if escape_next:
-            result.append(char)
-            escape_next = False
-        elif char == '\\':
-            result.append(char)
-            escape_next = True
-        elif char == '"':
-            result.append(char)
-            in_string = not in_string
-        elif char == '\n' and in_string:
-            # Replace newline inside string with space
-            result.append(' ')
-        else:
-            result.append(char)
+    return _JSON_STRING_RE.sub(lambda m: m.group(0).translate(_NEWLINES_TO_SPACES), json_str)
+
 
-        i += 1
+# A fenced code block: optional json tag, then the (whitespace-trimmed) body
+_FENCE_RE = re.compile(r"```(json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
 
-    return ''.join(result)
+
+def _try_parse(json_str: str) -> dict | None:
+    """Try to parse JSON, falling back to fixing broken strings, then Python literals."""
+    try:
+        return _json_loads(json_str)
+    except ValueError:
+        pass
+
+    # Try fixing broken strings
+    fixed = fix_broken_json_strings(json_str)
+    try:
+        return _json_loads(fixed)
+    except ValueError:
+        pass
+
+    # Some models answer with a Python dict (single quotes, True/None)
+    try:
+        result = ast.literal_eval(fixed)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _json_candidates(response: str) -> Iterator[str]:
+    """
+    Yield substrings of response that may hold the analysis JSON, best first.
+
+    Fenced ```json blocks come first, in order, then untagged fenced blocks,
+    then the first balanced {...} object, then the span from the first "{"
+    to the last "}". A candidate already yielded is not yielded again.
+    """
+    seen = set()
+    untagged = []
+    # Most streamed responses stop at the object's closing brace, before any
+    # closing fence; skip the regex unless a block can actually be complete
+    if response.find("```") != response.rfind("```"):
+        for match in _FENCE_RE.finditer(response):
+            block = match.group(2)
+            if block in seen:
+                continue
+            seen.add(block)
+            if match.group(1):
+                yield block
+            else:
+                untagged.append(block)
+        yield from untagged
+
+    start = response.find("{")
+    if start == -1:
+        return
+
+    # The brace scan respects JSON strings, so prose or a second object after
+    # the analysis doesn't end up in the candidate
+    tracker = _JsonObjectTracker()
+    if tracker.feed(response):
+        balanced = response[start : tracker.end]
+        if balanced not in seen:
+            seen.add(balanced)
+            yield balanced
+
+    # Fallback for objects the scan can't close, e.g. Python dicts whose
+    # single-quoted strings contain braces. A response holding a single
+    # fenced block has that block as its span.
+    end = response.rfind("}")
+    if end != -1 and response[start : end + 1] not in seen:
+        yield response[start : end + 1]
 
 
 def parse_analysis(response: str) -> dict | None:
     """Parse the JSON analysis from the response."""
-    import re
-
-    def try_parse(json_str: str) -> dict | None:
-        """Try to parse JSON, with fallback to fixing broken strings."""
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            # Try fixing broken strings
-            fixed = fix_broken_json_strings(json_str)
-            try:
-                return json.loads(fixed)
-            except Exception:
-                return None
-
-    # Try to find JSON between ```json and ```
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response)
-    if json_match:
-        result = try_parse(json_match.group(1).strip())
-        if result:
-            return result
-
-    # Try finding any ``` block
-    code_match = re.search(r'```\s*([\s\S]*?)\s*```', response)
-    if code_match:
-        result = try_parse(code_match.group(1).strip())
-        if result:
-            return result
-
-    # Try parsing from first { to last }
-    start = response.find('{')
-    end = response.rfind('}')
-    if start != -1 and end != -1:
-        result = try_parse(response[start:end+1])
-        if result:
-            return result
-
-    return None
+    # Candidates are generated lazily, so the first that parses ends the scan
+    return next(filter(None, map(_try_parse, _json_candidates(response))), None)
+
+
+def _bullets(items) -> str:
+    """Render items as a markdown bullet list, one "- item" per line."""
+    return "".join(f"- {item}\n" for item in items)
+
+
+def _quoted(items) -> str:
+    """Render items as a comma-separated list of double-quoted strings."""
+    return ", ".join(f'"{item}"' for item in items)
+
+
+# voice.md sections: each renders a heading, its body and a trailing blank line
+
+
+def _section_core_dna(core: dict) -> str:
+    out = "## Core DNA\n\n"
+    if "defining_tensions" in core:
+        out += "".join(f"**{tension}**\n\n" for tension in core["defining_tensions"])
+    if "primary_qualities" in core:
+        out += _bullets(core["primary_qualities"]) + "\n"
+    return out
+
+
+def _section_tone(ts: dict) -> str:
+    out = "## Tone Spectrum\n\n"
+    if "casual" in ts:
+        out += f"- **Casual (Teams/Slack)**: {ts['casual']}\n"
+    if "professional" in ts:
+        out += f"- **Professional (Email)**: {ts['professional']}\n"
+    if "formal" in ts:
+        out += f"- **Formal (Exec/External)**: {ts['formal']}\n"
+    return out + "\n"
+
+
+def _section_patterns(title: str, patterns: list) -> str:
+    return f"## {title}\n\n{_bullets(patterns)}\n"
+
+
+def _section_vocabulary(vocab: dict) -> str:
+    out = "## Vocabulary\n\n"
+    if "signature_phrases" in vocab:
+        phrase_lines = "".join(
+            f"- **{category.title()}**: {_quoted(phrases)}\n"
+            for category, phrases in vocab["signature_phrases"].items()
+            if phrases
+        )
+        out += f"### Signature Phrases\n\n{phrase_lines}\n"
+    if "avoided_words" in vocab or "banned_phrases" in vocab:
+        out += "### Avoid\n\n"
+        out += _bullets(vocab.get("avoided_words", []))
+        out += _bullets(f'"{phrase}"' for phrase in vocab.get("banned_phrases", []))
+        out += "\n"
+    return out
+
+
+def _section_structure(struct: dict) -> str:
+    out = "## Structural Patterns\n\n"
+    if "paragraph_style" in struct:
+        out += f"**Paragraph style**: {struct['paragraph_style']}\n\n"
+    if "list_usage" in struct:
+        out += f"**List usage**: {struct['list_usage']}\n\n"
+    out += "".join(
+        f"**{template.get('type', 'Template')}**:\n"
+        f"```\n{template.get('template', '')}\n```\n\n"
+        for template in struct.get("common_templates", [])
+    )
+    return out
+
+
+def _section_formatting(fmt: dict) -> str:
+    return f"## Formatting\n\n{_bullets(fmt.get('preferences', []))}\n"
+
+
+def _section_long_form(lf: dict) -> str:
+    out = "## Long-Form Writing\n\n"
+    if "typical_length" in lf:
+        out += f"**Typical length**: {lf['typical_length']}\n"
+    if "characteristics" in lf:
+        out += "\n" + _bullets(lf["characteristics"])
+    return out + "\n"
 
 
 def generate_voice_md(analysis: dict) -> str:
     """Generate voice.md content from analysis."""
-    lines = ["# Voice Profile", "", ""]
+    sections = ["# Voice Profile\n\n\n"]
 
-    # Core DNA
     if "core_dna" in analysis:
-        lines.append("## Core DNA")
-        lines.append("")
-        if "defining_tensions" in analysis["core_dna"]:
-            for tension in analysis["core_dna"]["defining_tensions"]:
-                lines.append(f"**{tension}**")
-                lines.append("")
-        if "primary_qualities" in analysis["core_dna"]:
-            for quality in analysis["core_dna"]["primary_qualities"]:
-                lines.append(f"- {quality}")
-            lines.append("")
-
-    # Tone Spectrum
+        sections.append(_section_core_dna(analysis["core_dna"]))
     if "tone_spectrum" in analysis:
-        lines.append("## Tone Spectrum")
-        lines.append("")
-        ts = analysis["tone_spectrum"]
-        if "casual" in ts:
-            lines.append(f"- **Casual (Teams/Slack)**: {ts['casual']}")
-        if "professional" in ts:
-            lines.append(f"- **Professional (Email)**: {ts['professional']}")
-        if "formal" in ts:
-            lines.append(f"- **Formal (Exec/External)**: {ts['formal']}")
-        lines.append("")
-
-    # Do patterns
-    if "do_patterns" in analysis and analysis["do_patterns"]:
-        lines.append("## Do")
-        lines.append("")
-        for pattern in analysis["do_patterns"]:
-            lines.append(f"- {pattern}")
-        lines.append("")
-
-    # Don't patterns
-    if "dont_patterns" in analysis and analysis["dont_patterns"]:
-        lines.append("## Don't")
-        lines.append("")
-        for pattern in analysis["dont_patterns"]:
-            lines.append(f"- {pattern}")
-        lines.append("")
-
-    # Vocabulary
+        sections.append(_section_tone(analysis["tone_spectrum"]))
+    if analysis.get("do_patterns"):
+        sections.append(_section_patterns("Do", analysis["do_patterns"]))
+    if analysis.get("dont_patterns"):
+        sections.append(_section_patterns("Don't", analysis["dont_patterns"]))
     if "vocabulary" in analysis:
-        lines.append("## Vocabulary")
-        lines.append("")
-        vocab = analysis["vocabulary"]
-
-        if "signature_phrases" in vocab:
-            lines.append("### Signature Phrases")
-            lines.append("")
-            for category, phrases in vocab["signature_phrases"].items():
-                if phrases:
-                    lines.append(
-                        f"- **{category.title()}**: {', '.join(f'\"{p}\"' for p in phrases)}"
-                    )
-            lines.append("")
-
-        if "avoided_words" in vocab or "banned_phrases" in vocab:
-            lines.append("### Avoid")
-            lines.append("")
-            for word in vocab.get("avoided_words", []):
-                lines.append(f"- {word}")
-            for phrase in vocab.get("banned_phrases", []):
-                lines.append(f"- \"{phrase}\"")
-            lines.append("")
-
-    # Structure
+        sections.append(_section_vocabulary(analysis["vocabulary"]))
     if "structure" in analysis:
-        lines.append("## Structural Patterns")
-        lines.append("")
-        struct = analysis["structure"]
-
-        if "paragraph_style" in struct:
-            lines.append(f"**Paragraph style**: {struct['paragraph_style']}")
-            lines.append("")
-        if "list_usage" in struct:
-            lines.append(f"**List usage**: {struct['list_usage']}")
-            lines.append("")
-
-        if "common_templates" in struct:
-            for template in struct["common_templates"]:
-                lines.append(f"**{template.get('type', 'Template')}**:")
-                lines.append("```")
-                lines.append(template.get("template", ""))
-                lines.append("```")
-                lines.append("")
-
-    # Formatting
+        sections.append(_section_structure(analysis["structure"]))
     if "formatting" in analysis:
-        lines.append("## Formatting")
-        lines.append("")
-        fmt = analysis["formatting"]
-        if "preferences" in fmt:
-            for pref in fmt["preferences"]:
-                lines.append(f"- {pref}")
-        lines.append("")
-
-    # Long-form
+        sections.append(_section_formatting(analysis["formatting"]))
     if "long_form" in analysis:
-        lines.append("## Long-Form Writing")
-        lines.append("")
-        lf = analysis["long_form"]
-        if "typical_length" in lf:
-            lines.append(f"**Typical length**: {lf['typical_length']}")
-        if "characteristics" in lf:
-            lines.append("")
-            for char in lf["characteristics"]:
-                lines.append(f"- {char}")
-        lines.append("")
+        sections.append(_section_long_form(analysis["long_form"]))
 
-    return "\n".join(lines)
+    # Each section ends with a newline; the document doesn't
+    return "".join(sections)[:-1]
 
 
-def analyze_voice(
+def _prepare_analysis(
     config: Config,
-    samples_path: Path | None = None,
-    api_key: str | None = None,
-    model: str = "google/gemini-3-flash-preview",
-) -> VoiceAnalysisResult:
+    samples_path: Path | None,
+    api_key: str | None,
+    timings: dict[str, float] | None = None,
+) -> tuple[str, str, int] | VoiceAnalysisResult:
     """
-    Analyze writing samples and generate voice profile.
+    Resolve the API key and build the prompt, or return an error result.
 
-    Args:
-        config: Continuum configuration
-        samples_path: Path to samples directory (default: ~/.continuum/samples)
-        api_key: OpenRouter API key (default: from env OPENROUTER_API_KEY)
-        model: Model to use for analysis
-
-    Returns:
-        VoiceAnalysisResult with the analysis
+    If timings is given, the "collect" and "prompt" phases are recorded in it.
     """
+    if timings is None:
+        timings = {}
+
     # Get samples path
     if samples_path is None:
         samples_path = config.base_path / "samples"
@@ -396,35 +708,195 @@ def analyze_voice(
             )
 
     # Collect samples
+    start = time.perf_counter()
     samples = collect_samples(samples_path)
-    if not samples:
+    timings["collect"] = time.perf_counter() - start
+
+    # Count samples; empty category directories still appear as keys
+    total_samples = sum(len(v) for v in samples.values())
+    if not total_samples:
         return VoiceAnalysisResult(
             raw_response="",
             parsed=None,
-            error=f"No samples found in {samples_path}. Add .md or .txt files to analyze.",
+            error=f"No samples found in {samples_path}. Add .md, .txt, or .eml files to analyze.",
         )
 
-    # Count samples
-    total_samples = sum(len(v) for v in samples.values())
-
-    # Build prompt
+    start = time.perf_counter()
     prompt = build_prompt(samples)
+    timings["prompt"] = time.perf_counter() - start
 
-    # Call API
-    try:
-        response = call_openrouter(prompt, api_key, model)
-    except httpx.HTTPStatusError as e:
-        return VoiceAnalysisResult(
-            raw_response="",
-            parsed=None,
-            error=f"API error: {e.response.status_code} - {e.response.text}",
-        )
-    except Exception as e:
+    return prompt, api_key, total_samples
+
+
+def _analysis_result(
+    response: str | BaseException,
+    sample_count: int,
+    timings: dict[str, float] | None = None,
+) -> VoiceAnalysisResult:
+    """Turn an API response, or the exception raised instead, into a result."""
+    timings = dict(timings or {})
+    if isinstance(response, BaseException):
+        import httpx
+
+        if isinstance(response, httpx.HTTPStatusError):
+            error = f"API error: {response.response.status_code} - {response.response.text}"
+        else:
+            error = f"Error calling API: {response}"
         return VoiceAnalysisResult(
-            raw_response="", parsed=None, error=f"Error calling API: {e}"
+            raw_response="", parsed=None, error=error, sample_count=sample_count, timings=timings
         )
 
     # Parse response
+    start = time.perf_counter()
     parsed = parse_analysis(response)
+    timings["parse"] = time.perf_counter() - start
+
+    return VoiceAnalysisResult(
+        raw_response=response,
+        parsed=parsed,
+        error=None,
+        sample_count=sample_count,
+        timings=timings,
+    )
+
+
+def _cache_path(config: Config, model: str, prompt: str) -> Path:
+    """Location of the cached analysis for this model and exact prompt."""
+    key = hashlib.sha256(f"{model}\0{prompt}".encode("utf-8", "surrogatepass")).hexdigest()
+    return config.base_path / ".cache" / "voice" / f"{key}.json"
+
+
+def _load_cached_result(path: Path, max_age_days: int) -> VoiceAnalysisResult | None:
+    """Return a cached analysis younger than max_age_days, if there is one."""
+    try:
+        if time.time() - os.stat(path).st_mtime > max_age_days * 86400:
+            return None
+        data = json.loads(path.read_bytes())
+        return VoiceAnalysisResult(
+            raw_response=data["raw_response"],
+            parsed=data["parsed"],
+            sample_count=data["sample_count"],
+            cached=True,
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_result(path: Path, result: VoiceAnalysisResult) -> None:
+    """Cache a successfully parsed analysis; failures are never cached."""
+    if result.error or result.parsed is None:
+        return
+    data = {
+        "raw_response": result.raw_response,
+        "parsed": result.parsed,
+        "sample_count": result.sample_count,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def analyze_voice(
+    config: Config,
+    samples_path: Path | None = None,
+    api_key: str | None = None,
+    model: str = "google/gemini-3-flash-preview",
+    use_cache: bool = True,
+) -> VoiceAnalysisResult:
+    """
+    Analyze writing samples and generate voice profile.
+
+    Successful analyses are cached under ~/.continuum/.cache/voice/, keyed
+    by model and the exact prompt, and reused for up to stale_days. The
+    result's timings record how long each phase took (collect, prompt,
+    request, parse), for telling slow I/O from a slow model.
+
+    Args:
+        config: Continuum configuration
+        samples_path: Path to samples directory (default: ~/.continuum/samples)
+        api_key: OpenRouter API key (default: from env OPENROUTER_API_KEY)
+        model: Model to use for analysis
+        use_cache: Reuse a cached analysis of identical samples if available
+
+    Returns:
+        VoiceAnalysisResult with the analysis
+    """
+    timings: dict[str, float] = {}
+    prepared = _prepare_analysis(config, samples_path, api_key, timings)
+    if isinstance(prepared, VoiceAnalysisResult):
+        return prepared
+    prompt, api_key, total_samples = prepared
+
+    cache_path = _cache_path(config, model, prompt)
+    if use_cache:
+        cached = _load_cached_result(cache_path, config.stale_days)
+        if cached:
+            return replace(cached, timings=timings)
+
+    # Call API
+    start = time.perf_counter()
+    try:
+        response = call_openrouter(prompt, api_key, model, stream=True)
+    except Exception as e:
+        response = e
+    timings["request"] = time.perf_counter() - start
+
+    result = _analysis_result(response, total_samples, timings)
+    _store_result(cache_path, result)
+    return result
+
+
+async def analyze_voice_batch(
+    config: Config,
+    models: list[str],
+    samples_path: Path | None = None,
+    api_key: str | None = None,
+    use_cache: bool = True,
+    max_concurrency: int = 4,
+) -> list[VoiceAnalysisResult]:
+    """
+    Analyze the same writing samples with several models concurrently.
+
+    The requests share one HTTP client and run with asyncio.gather, so the
+    batch takes about as long as the slowest model. Results are returned
+    in the order of models; a failed request only affects its own result.
+    Models with a cached analysis (see analyze_voice) aren't requested,
+    and at most max_concurrency requests are in flight at once.
+    """
+    timings: dict[str, float] = {}
+    prepared = _prepare_analysis(config, samples_path, api_key, timings)
+    if isinstance(prepared, VoiceAnalysisResult):
+        return [prepared] * len(models)
+    prompt, api_key, total_samples = prepared
+
+    cache_paths = [_cache_path(config, model, prompt) for model in models]
+    results: list[VoiceAnalysisResult | None] = [
+        _load_cached_result(path, config.stale_days) if use_cache else None
+        for path in cache_paths
+    ]
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    if pending:
+        import httpx
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limits = httpx.Limits(max_connections=32)
+        async with httpx.AsyncClient(timeout=120.0, http2=_HTTP2, limits=limits) as client:
+            responses = await asyncio.gather(
+                *(
+                    call_openrouter_async(
+                        prompt, api_key, models[i], client=client, semaphore=semaphore
+                    )
+                    for i in pending
+                ),
+                return_exceptions=True,
+            )
+        for i, response in zip(pending, responses):
+            results[i] = _analysis_result(response, total_samples, timings)
+            _store_result(cache_paths[i], results[i])
 
-    return VoiceAnalysisResult(raw_response=response, parsed=parsed, error=None)
+    return results
@@ -0,0 +1,174 @@
+"""Voice profile commands for the Continuum CLI.
+
+Loaded on demand by the top-level ``cli`` group so that commands which never
+touch voice analysis don't pay for its imports.
+"""
+
+import os
+from pathlib import Path
+
+import click
+
+from .cli import console, load_config, resolve_base_path
+
+
+@click.group()
+def voice():
+    """Voice profile commands."""
+    pass
+
+
+@voice.command("analyze")
+@click.option(
+    "--samples",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to samples directory (default: ~/.continuum/samples)",
+)
+@click.option(
+    "--model",
+    default="google/gemini-3-flash-preview",
+    help="OpenRouter model to use for analysis",
+)
+@click.option("--dry-run", is_flag=True, help="Show analysis without updating voice.md")
+@click.option("--raw", is_flag=True, help="Show raw API response")
+@click.option("--no-cache", is_flag=True, help="Ignore any cached analysis of the same samples")
+@click.option("--timing", is_flag=True, help="Show how long each analysis phase took")
+@click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
+def voice_analyze(
+    samples: str | None,
+    model: str,
+    dry_run: bool,
+    raw: bool,
+    no_cache: bool,
+    timing: bool,
+    path: str | None,
+):
+    """Analyze writing samples to generate voice profile.
+
+    Reads samples from ~/.continuum/samples/ (or --samples path) and uses
+    an LLM to extract voice patterns, vocabulary, and structural preferences.
+
+    Requires OPENROUTER_API_KEY environment variable.
+
+    Example:
+        continuum voice analyze
+        continuum voice analyze --dry-run
+        continuum voice analyze --samples ~/my-emails/
+    """
+    from .voice import analyze_voice, generate_voice_md
+
+    base_path = resolve_base_path(path)
+    config = load_config(base_path)
+
+    samples_path = Path(samples).expanduser() if samples else config.base_path / "samples"
+
+    # Check for API key early
+    if not os.environ.get("OPENROUTER_API_KEY"):
+        console().print("[red]Error: OPENROUTER_API_KEY environment variable not set[/red]")
+        console().print()
+        console().print("Set it with:")
+        console().print("  export OPENROUTER_API_KEY=your-key-here")
+        return
+
+    # Check for samples
+    if not samples_path.exists():
+        console().print(f"[red]Samples directory not found: {samples_path}[/red]")
+        console().print()
+        console().print("Create it and add writing samples:")
+        console().print(f"  mkdir -p {samples_path}/emails")
+        console().print(f"  mkdir -p {samples_path}/technical")
+        console().print("  # Add .md or .txt files to these directories")
+        return
+
+    # analyze_voice counts samples while collecting them, so there's no
+    # separate directory walk up front
+    console().print("[bold]Analyzing samples...[/bold]")
+    console().print(f"  Samples: {samples_path}")
+    console().print(f"  Model: {model}")
+    console().print()
+
+    with console().status("[bold green]Calling API..."):
+        result = analyze_voice(config, samples_path, model=model, use_cache=not no_cache)
+
+    if timing and result.timings:
+        phases = ", ".join(f"{name} {secs * 1000:.1f}ms" for name, secs in result.timings.items())
+        console().print(f"[dim]Timing: {phases}[/dim]")
+
+    if result.error:
+        console().print(f"[red]Error: {result.error}[/red]")
+        return
+
+    cached_note = " (cached result; --no-cache to re-run)" if result.cached else ""
+    console().print(f"[dim]Analyzed {result.sample_count} samples{cached_note}[/dim]")
+
+    if raw:
+        console().print("[bold]Raw API Response:[/bold]")
+        console().print(result.raw_response)
+        return
+
+    if not result.parsed:
+        console().print("[yellow]Warning: Could not parse structured response[/yellow]")
+        console().print()
+        console().print("[bold]Raw response:[/bold]")
+        console().print(result.raw_response)
+        return
+
+    # Generate voice.md content
+    voice_content = generate_voice_md(result.parsed)
+
+    if dry_run:
+        console().print("[bold]Generated voice.md (dry run):[/bold]")
+        console().print()
+        console().print(voice_content)
+        console().print()
+        console().print("[dim]Use without --dry-run to update voice.md[/dim]")
+    else:
+        # Write to voice.md
+        voice_path = config.voice_path
+        voice_path.write_text(voice_content)
+        console().print(f"[green]Updated {voice_path}[/green]")
+        console().print()
+        console().print("Review with:")
+        console().print(f"  continuum edit voice")
+
+
+@voice.command("samples")
+@click.option("--path", type=click.Path(), default=None, help="Custom Continuum directory")
+def voice_samples(path: str | None):
+    """Show sample collection status."""
+    base_path = resolve_base_path(path)
+    samples_path = base_path / "samples"
+
+    if not samples_path.exists():
+        console().print(f"[yellow]Samples directory not found: {samples_path}[/yellow]")
+        console().print()
+        console().print("Create it with:")
+        console().print(f"  mkdir -p {samples_path}/emails")
+        console().print(f"  mkdir -p {samples_path}/technical")
+        console().print(f"  mkdir -p {samples_path}/feedback")
+        return
+
+    console().print(f"[bold]Samples directory: {samples_path}[/bold]")
+    console().print()
+
+    # Count exactly what analyze would send: hidden, empty, non-text and
+    # duplicate files are skipped, and loose files count as "general"
+    from .voice import collect_samples
+
+    samples = collect_samples(samples_path)
+    total = 0
+    for category in sorted(samples):
+        count = len(samples[category])
+        total += count
+        status = "[green]" if count > 0 else "[dim]"
+        is_dir = (samples_path / category).is_dir()
+        label = f"{category}/" if is_dir else f"{category} (files in {samples_path.name}/)"
+        console().print(f"  {status}{label}[/] {count} files")
+
+    console().print()
+    console().print(f"[bold]Total: {total} samples[/bold]")
+
+    if total == 0:
+        console().print()
+        console().print("[dim]Add writing samples (.md, .txt, .eml) to analyze[/dim]")
@@ -1,10 +1,14 @@
 """Tests for Continuum CLI."""
 
+import json
+import os
+
+import click
 import pytest
 from click.testing import CliRunner
 from pathlib import Path
 
-from continuum.cli import cli, auto_detect_category
+from continuum.cli import cli, auto_detect_category, load_config
 
 
 @pytest.fixture
@@ -114,6 +118,27 @@ class TestRemember:
         assert "DECISION" in result.output
 
 
+class TestEdit:
+    """Tests for the edit command."""
+
+    def test_project_voice_created_on_first_edit(self, runner, temp_continuum, monkeypatch):
+        """edit --project should create a missing project voice.md stub."""
+        opened = []
+        monkeypatch.setattr("continuum.cli.open_in_editor", lambda p: opened.append(p) or True)
+        runner.invoke(cli, ["init", "--path", str(temp_continuum)])
+
+        with runner.isolated_filesystem():
+            Path(".continuum").mkdir()
+            result = runner.invoke(
+                cli, ["edit", "voice", "--project", "--path", str(temp_continuum)]
+            )
+            voice = Path(".continuum/voice.md").read_text()
+
+        assert result.exit_code == 0
+        assert voice == "# Project Voice\n\n"
+        assert opened and opened[0].name == "voice.md"
+
+
 class TestAutoDetectCategory:
     """Tests for category auto-detection."""
 
@@ -132,6 +157,11 @@ class TestAutoDetectCategory:
         assert auto_detect_category("I always use type hints") == "preference"
         assert auto_detect_category("Never use global state") == "preference"
 
+    def test_earlier_category_wins_over_overlapping_keyword(self):
+        # "always" overlaps "selected"; "want" overlaps "turns out"
+        assert auto_detect_category("alwayselected") == "decision"
+        assert auto_detect_category("I wanturns out") == "lesson"
+
     def test_defaults_to_fact(self):
         assert auto_detect_category("Team size is 80 people") == "fact"
         assert auto_detect_category("The API endpoint is /v1/users") == "fact"
@@ -221,3 +251,137 @@ class TestValidate:
         result = runner.invoke(cli, ["validate", "--path", str(temp_continuum)])
 
         assert "Missing" in result.output
+
+
+class TestLazyCommands:
+    """Tests for lazily loaded command groups."""
+
+    def test_help_lists_lazy_groups(self, runner):
+        """Top-level help should list lazily loaded groups."""
+        result = runner.invoke(cli, ["--help"])
+
+        assert result.exit_code == 0
+        assert "voice" in result.output
+
+    def test_voice_samples_missing_dir(self, runner, temp_continuum):
+        """Lazily loaded voice commands should run normally."""
+        result = runner.invoke(cli, ["voice", "samples", "--path", str(temp_continuum)])
+
+        assert result.exit_code == 0
+        assert "Samples directory not found" in result.output
+
+    def test_voice_samples_counts(self, runner, temp_continuum):
+        """voice samples should count files per category directory."""
+        samples = temp_continuum / "samples"
+        (samples / "emails").mkdir(parents=True)
+        (samples / "emails" / "a.md").write_text("a")
+        (samples / "emails" / "b.md").write_text("b")
+        (samples / "technical").mkdir()
+        (samples / "loose.txt").write_text("c")
+
+        result = runner.invoke(cli, ["voice", "samples", "--path", str(temp_continuum)])
+
+        assert result.exit_code == 0
+        assert "emails/ 2 files" in result.output
+        assert "technical/ 0 files" in result.output
+        assert "general (files in samples/) 1 files" in result.output
+        assert "Total: 3 samples" in result.output
+
+    def test_voice_samples_total_matches_collected(self, runner, temp_continuum):
+        """voice samples should report the count analyze would actually send."""
+        from continuum.voice import collect_samples
+
+        samples = temp_continuum / "samples"
+        (samples / "emails").mkdir(parents=True)
+        (samples / "emails" / "a.md").write_text("hello")
+        (samples / "emails" / "copy.md").write_text("hello")
+        (samples / "emails" / "B.MD").write_text("world")
+        (samples / "emails" / ".hidden.md").write_text("secret")
+        (samples / "emails" / "empty.md").write_text("")
+        (samples / "emails" / "photo.jpg").write_bytes(b"\xff\xd8")
+
+        result = runner.invoke(cli, ["voice", "samples", "--path", str(temp_continuum)])
+
+        collected = sum(len(contents) for contents in collect_samples(samples).values())
+        assert result.exit_code == 0
+        assert collected == 2
+        assert f"Total: {collected} samples" in result.output
+
+    def test_voice_analyze_empty_category_makes_no_api_call(
+        self, runner, temp_continuum, monkeypatch
+    ):
+        """An empty category directory is no samples, not an analysis of nothing."""
+        runner.invoke(cli, ["init", "--path", str(temp_continuum)])
+        (temp_continuum / "samples" / "emails").mkdir(parents=True, exist_ok=True)
+        voice_before = (temp_continuum / "voice.md").read_text()
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+
+        calls = []
+        monkeypatch.setattr("continuum.voice.call_openrouter", lambda *a, **k: calls.append(a))
+
+        result = runner.invoke(cli, ["voice", "analyze", "--path", str(temp_continuum)])
+
+        assert result.exit_code == 0
+        assert "No samples found" in result.output
+        assert calls == []
+        assert (temp_continuum / "voice.md").read_text() == voice_before
+
+
+class TestLoadConfig:
+    """Tests for load_config()."""
+
+    def test_cached_within_invocation(self, temp_continuum):
+        with click.Context(cli):
+            assert load_config(temp_continuum) is load_config(temp_continuum)
+
+    def test_outside_invocation(self, temp_continuum):
+        config = load_config(temp_continuum)
+        assert config.base_path == temp_continuum
+
+
+class TestServeConfig:
+    """Tests for the serve config command."""
+
+    def test_stdio_config(self, runner):
+        """Default config should point at the continuum-mcp executable."""
+        result = runner.invoke(cli, ["serve", "config"])
+
+        assert result.exit_code == 0
+        assert '"continuum"' in result.output
+        assert "continuum-mcp" in result.output
+        assert '"args": []' in result.output
+
+    def test_http_config_is_valid_json(self, runner):
+        """Remote config should be valid JSON with the MCP endpoint URL."""
+        result = runner.invoke(cli, ["serve", "config", "--http"])
+
+        assert result.exit_code == 0
+        snippet = result.output[result.output.index("{") : result.output.rindex("}") + 1]
+        config = json.loads(snippet)
+        assert config["continuum"]["transport"] == "http"
+        assert config["continuum"]["url"].endswith("/mcp")
+
+
+class TestEnvLoading:
+    """Tests for .env loading in the CLI group."""
+
+    @pytest.fixture
+    def clean_env(self, monkeypatch):
+        # setenv first so monkeypatch restores the original state afterwards
+        monkeypatch.setenv("OPENROUTER_API_KEY", "placeholder")
+        monkeypatch.delenv("OPENROUTER_API_KEY")
+
+    def test_help_skips_env_files(self, runner, clean_env):
+        with runner.isolated_filesystem():
+            Path(".env").write_text("OPENROUTER_API_KEY=from-dotenv\n")
+            result = runner.invoke(cli, ["--help"])
+
+        assert result.exit_code == 0
+        assert "OPENROUTER_API_KEY" not in os.environ
+
+    def test_command_loads_env_file(self, runner, clean_env, temp_continuum):
+        with runner.isolated_filesystem():
+            Path(".env").write_text("OPENROUTER_API_KEY=from-dotenv\n")
+            runner.invoke(cli, ["status", "--path", str(temp_continuum)])
+
+        assert os.environ["OPENROUTER_API_KEY"] == "from-dotenv"
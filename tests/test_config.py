@@ -1,9 +1,18 @@
 """Tests for config module."""
 
+import os
+
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
-from continuum.config import Config, find_project_root, get_default_base_path
+from continuum.config import (
+    Config,
+    clear_project_root_cache,
+    find_project_root,
+    get_default_base_path,
+    load_env_file,
+)
 
 
 class TestFindProjectRoot:
@@ -33,6 +42,22 @@ class TestFindProjectRoot:
         result = find_project_root(sub)
         assert result == tmp_path
 
+    @pytest.mark.parametrize("marker", ["package.json", "Cargo.toml"])
+    def test_finds_other_marker_files(self, tmp_path, marker):
+        (tmp_path / marker).write_text("")
+        sub = tmp_path / "a" / "b"
+        sub.mkdir(parents=True)
+
+        assert find_project_root(sub) == tmp_path
+
+    def test_nearest_marker_wins(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        inner = tmp_path / "packages" / "web"
+        inner.mkdir(parents=True)
+        (inner / "package.json").write_text("{}")
+
+        assert find_project_root(inner / ".") == inner
+
     def test_returns_none_for_no_markers(self, tmp_path):
         bare = tmp_path / "bare" / "dir"
         bare.mkdir(parents=True)
@@ -43,6 +68,35 @@ class TestFindProjectRoot:
         # We test the logic rather than a specific return value
         assert result is None or result != bare
 
+    def test_caches_per_start_path(self, tmp_path):
+        sub = tmp_path / "src"
+        sub.mkdir()
+        (tmp_path / ".git").mkdir()
+        clear_project_root_cache()
+
+        with patch("continuum.config.os.scandir", wraps=os.scandir) as scandir:
+            assert find_project_root(sub) == tmp_path
+            assert find_project_root(sub) == tmp_path
+        assert scandir.call_count == 2  # src, then its parent; not repeated
+
+    def test_picks_up_added_marker(self, tmp_path):
+        sub = tmp_path / "src"
+        sub.mkdir()
+        (tmp_path / ".git").mkdir()
+        assert find_project_root(sub) == tmp_path
+
+        (sub / "Cargo.toml").write_text("")
+        assert find_project_root(sub) == sub
+
+    def test_picks_up_marker_in_unmarked_dir(self, tmp_path):
+        bare = tmp_path / "bare"
+        bare.mkdir()
+        # None here, unless something above tmp_path happens to be marked
+        assert find_project_root(bare) != bare
+
+        (bare / ".continuum").mkdir()
+        assert find_project_root(bare) == bare
+
 
 class TestConfig:
     """Tests for Config class."""
@@ -114,9 +168,168 @@ class TestConfig:
         assert config.project_path == project_dir / ".continuum"
 
 
+class TestContextFileSnapshot:
+    """Tests for the context-file existence snapshot taken at construction."""
+
+    def test_project_paths_reflect_existing_files(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+        project = tmp_path / "project" / ".continuum"
+        project.mkdir(parents=True)
+        (project / "voice.md").write_text("# Voice")
+
+        config = Config(base_path=base, project_path=project)
+
+        assert config.project_voice_path == project / "voice.md"
+        assert config.project_identity_path is None
+        assert config.project_context_path is None
+        assert config.project_memory_path is None
+
+    def test_effective_path_prefers_project(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+        (base / "identity.md").write_text("# Global")
+        (base / "context.md").write_text("# Global")
+        project = tmp_path / "project" / ".continuum"
+        project.mkdir(parents=True)
+        (project / "identity.md").write_text("# Project")
+        (project / "context.md").write_text("# Project")
+
+        config = Config(base_path=base, project_path=project)
+
+        assert config.get_effective_path("identity") == project / "identity.md"
+        # Context is never overridden by the project copy
+        assert config.get_effective_path("context") == base / "context.md"
+        assert config.get_effective_path("memory") is None
+
+
+class TestLoadCached:
+    """Tests for Config.load_cached()."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        Config.clear_cache()
+        yield
+        Config.clear_cache()
+
+    def test_reuses_config(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+        (base / "config.yaml").write_text("stale_days: 7\n")
+
+        first = Config.load_cached(base_path=base, start_path=tmp_path)
+        second = Config.load_cached(base_path=base, start_path=tmp_path)
+
+        assert first is second
+        assert first.stale_days == 7
+
+    def test_reloads_after_config_change(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+        config_file = base / "config.yaml"
+        config_file.write_text("stale_days: 7\n")
+        first = Config.load_cached(base_path=base, start_path=tmp_path)
+
+        config_file.write_text("stale_days: 3\n")
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        second = Config.load_cached(base_path=base, start_path=tmp_path)
+        assert second is not first
+        assert second.stale_days == 3
+
+    def test_picks_up_new_project_dir(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".git").mkdir()
+
+        assert not Config.load_cached(base_path=base, start_path=project).has_project
+
+        (project / ".continuum").mkdir()
+        config = Config.load_cached(base_path=base, start_path=project)
+        assert config.project_path == project / ".continuum"
+
+    def test_picks_up_project_dir_without_prior_marker(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+        start = tmp_path / "scratch"
+        start.mkdir()
+
+        assert Config.load_cached(base_path=base, start_path=start).project_path != start / ".continuum"
+
+        (start / ".continuum").mkdir()
+        config = Config.load_cached(base_path=base, start_path=start)
+        assert config.project_path == start / ".continuum"
+
+    def test_picks_up_nearer_project_dir(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+        outer = tmp_path / "outer"
+        inner = outer / "inner"
+        (outer / ".continuum").mkdir(parents=True)
+        inner.mkdir()
+
+        assert Config.load_cached(base_path=base, start_path=inner).project_path == outer / ".continuum"
+
+        (inner / ".continuum").mkdir()
+        config = Config.load_cached(base_path=base, start_path=inner)
+        assert config.project_path == inner / ".continuum"
+
+    def test_picks_up_new_context_file(self, tmp_path):
+        base = tmp_path / "base"
+        base.mkdir()
+
+        assert Config.load_cached(base_path=base, start_path=tmp_path).get_effective_path("memory") is None
+
+        (base / "memory.md").write_text("# Memory")
+        config = Config.load_cached(base_path=base, start_path=tmp_path)
+        assert config.get_effective_path("memory") == base / "memory.md"
+
+
 class TestGetDefaultBasePath:
     """Tests for get_default_base_path()."""
 
     def test_returns_home_continuum(self):
         result = get_default_base_path()
         assert result == Path.home() / ".continuum"
+
+
+class TestLoadEnvFile:
+    """Tests for load_env_file()."""
+
+    def test_loads_values(self, tmp_path, monkeypatch):
+        for key in ("CT_PLAIN", "CT_DOUBLE", "CT_SINGLE", "CT_EXPORTED", "CT_COMMENTED"):
+            monkeypatch.delenv(key, raising=False)
+        env = tmp_path / ".env"
+        env.write_text(
+            "# comment\n"
+            "\n"
+            "CT_PLAIN=plain\n"
+            'CT_DOUBLE="double quoted # not a comment"\n'
+            "CT_SINGLE='single'\n"
+            "export CT_EXPORTED=exported\n"
+            "CT_COMMENTED=value # trailing comment\n"
+            "not a variable\n"
+        )
+
+        load_env_file(env)
+
+        assert os.environ["CT_PLAIN"] == "plain"
+        assert os.environ["CT_DOUBLE"] == "double quoted # not a comment"
+        assert os.environ["CT_SINGLE"] == "single"
+        assert os.environ["CT_EXPORTED"] == "exported"
+        assert os.environ["CT_COMMENTED"] == "value"
+
+    def test_existing_environment_wins(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CT_EXISTING", "from-env")
+        env = tmp_path / ".env"
+        env.write_text("CT_EXISTING=from-file\n")
+
+        load_env_file(env)
+
+        assert os.environ["CT_EXISTING"] == "from-env"
+
+    def test_missing_file(self, tmp_path):
+        load_env_file(tmp_path / ".env")
@@ -28,6 +28,18 @@ class TestCondenseContent:
         result = condense_content(content, max_words=10)
         assert "# Title" in result
 
+    def test_long_line_over_budget_dropped(self):
+        content = "# Title\nShort intro.\n" + " ".join(["word"] * 10_000)
+        result = condense_content(content, max_words=20)
+        assert result == "# Title\nShort intro.\n"
+
+    def test_repeated_call_is_memoized(self):
+        content = "# Title\n\n" + " ".join(["word"] * 50) + "\nunique-7f3a"
+        first = condense_content(content, 10)
+        hits = condense_content.cache_info().hits
+        assert condense_content(content, 10) == first
+        assert condense_content.cache_info().hits == hits + 1
+
     def test_empty_content(self):
         result = condense_content("", max_words=500)
         assert result == ""
@@ -67,6 +79,12 @@ class TestFilterRecentMemory:
         # "bad-date" doesn't parse as YYYY-MM-DD or YYYY-MM, so no entries
         assert result == ""
 
+    def test_month_dates_and_invalid_days(self):
+        month = datetime.now().strftime("%Y-%m")
+        content = f"# Memory\n\n[{month}] FACT - Monthly entry\n[2024-02-30] FACT - No such day"
+        result = filter_recent_memory(content, days=30, max_entries=20)
+        assert result == f"[{month}] FACT - Monthly entry"
+
 
 class TestGenerateExport:
     """Tests for generate_export()."""
@@ -0,0 +1,219 @@
+"""Tests for files module."""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+from pathlib import Path
+
+from continuum.files import (
+    append_memory_entries,
+    append_memory_entry,
+    count_memory_entries,
+    create_file,
+    extract_current_focus,
+    get_file_age_str,
+    init_project,
+    is_dated_entry,
+    is_stale,
+    scan_dir_stats,
+    today_str,
+)
+
+
+class TestScanDirStats:
+    """Tests for scan_dir_stats()."""
+
+    def test_returns_stats_for_files(self, tmp_path):
+        (tmp_path / "identity.md").write_text("# Identity")
+        (tmp_path / "memory.md").write_text("# Memory")
+        (tmp_path / "exports").mkdir()
+
+        stats = scan_dir_stats(tmp_path)
+
+        assert set(stats) == {"identity.md", "memory.md"}
+        assert stats["identity.md"].st_size == len("# Identity")
+
+    def test_missing_directory(self, tmp_path):
+        assert scan_dir_stats(tmp_path / "nonexistent") == {}
+
+    def test_none_directory(self):
+        assert scan_dir_stats(None) == {}
+
+
+class TestFileAge:
+    """Tests for is_stale() and get_file_age_str()."""
+
+    def test_missing_file(self, tmp_path):
+        missing = tmp_path / "missing.md"
+        assert get_file_age_str(missing) == "missing"
+        assert is_stale(missing, 14) is False
+
+    def test_uses_provided_stat(self, tmp_path):
+        path = tmp_path / "context.md"
+        path.write_text("# Context")
+        old = time.time() - 20 * 86400
+        os.utime(path, (old, old))
+
+        st = os.stat(path)
+        path.unlink()
+
+        assert is_stale(path, 14, st=st) is True
+        assert get_file_age_str(path, st=st) == "2 weeks ago"
+
+    def test_age_strings(self, tmp_path):
+        path = tmp_path / "context.md"
+        path.write_text("# Context")
+
+        cases = (
+            (90, "1 minute ago"),
+            (2 * 3600 + 60, "2 hours ago"),
+            (86400 + 60, "1 day ago"),
+            (3 * 86400 + 60, "3 days ago"),
+            (45 * 86400, "1 month ago"),
+            (95 * 86400, "3 months ago"),
+        )
+        for age_seconds, expected in cases:
+            mtime = time.time() - age_seconds
+            os.utime(path, (mtime, mtime))
+            assert get_file_age_str(path) == expected
+
+    def test_stale_boundary(self, tmp_path):
+        path = tmp_path / "memory.md"
+        path.write_text("# Memory")
+
+        for age_days, expected in ((14.5, False), (15.5, True)):
+            mtime = time.time() - age_days * 86400
+            os.utime(path, (mtime, mtime))
+            assert is_stale(path, 14) is expected
+
+
+class TestAppendMemoryEntry:
+    """Tests for append_memory_entry()."""
+
+    def test_appends_on_new_line(self, tmp_path):
+        memory = tmp_path / "memory.md"
+        memory.write_text("# Memory\n")
+
+        append_memory_entry(memory, "[2025-01-01] FACT - First")
+        append_memory_entry(memory, "[2025-01-02] FACT - Second")
+
+        assert memory.read_text() == (
+            "# Memory\n\n[2025-01-01] FACT - First\n[2025-01-02] FACT - Second"
+        )
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            append_memory_entry(tmp_path / "memory.md", "entry")
+
+    def test_appends_batch(self, tmp_path):
+        memory = tmp_path / "memory.md"
+        memory.write_text("# Memory\n")
+
+        append_memory_entries(memory, ["[2025-01-01] FACT - A", "[2025-01-01] FACT - B"])
+
+        assert memory.read_text() == "# Memory\n\n[2025-01-01] FACT - A\n[2025-01-01] FACT - B"
+
+    def test_fsync_once_per_batch(self, tmp_path):
+        from unittest.mock import patch
+
+        memory = tmp_path / "memory.md"
+        memory.write_text("# Memory\n")
+
+        with patch("continuum.files.os.fsync") as fsync:
+            append_memory_entries(memory, ["A", "B"])
+            assert fsync.call_count == 0
+            append_memory_entries(memory, ["C", "D"], fsync=True)
+            assert fsync.call_count == 1
+
+
+class TestTodayStr:
+    """Tests for today_str()."""
+
+    def test_matches_local_date(self):
+        assert today_str() == datetime.now().strftime("%Y-%m-%d")
+
+    def test_cached_value_reused(self):
+        assert today_str() is today_str()
+
+
+class TestCreateFile:
+    """Tests for create_file()."""
+
+    def test_creates_new_file(self, tmp_path):
+        path = tmp_path / "voice.md"
+        assert create_file(path, b"# Project Voice\n\n") is True
+        assert path.read_text() == "# Project Voice\n\n"
+
+    def test_leaves_existing_file(self, tmp_path):
+        path = tmp_path / "voice.md"
+        path.write_text("Custom")
+        assert create_file(path, b"# Project Voice\n\n") is False
+        assert path.read_text() == "Custom"
+
+
+class TestCountMemoryEntries:
+    """Tests for count_memory_entries() and is_dated_entry()."""
+
+    def test_counts_dated_lines(self, tmp_path):
+        path = tmp_path / "memory.md"
+        path.write_text(
+            "# Memory\n\n"
+            "[2025-01-15] FACT - One\n"
+            "  [2025-02] LESSON - Two\n"
+            "[note] not dated\n"
+            "continuation line\n"
+            "[2025-03-01 DECISION - unterminated\n"
+        )
+        assert count_memory_entries(path) == 2
+
+    def test_missing_file(self, tmp_path):
+        assert count_memory_entries(tmp_path / "memory.md") == 0
+
+    def test_is_dated_entry(self):
+        assert is_dated_entry("[2025-1-5] FACT - x")
+        assert not is_dated_entry("[2025] FACT - x")
+        assert not is_dated_entry("text [2025-01-01]")
+
+
+class TestExtractCurrentFocus:
+    """Tests for extract_current_focus()."""
+
+    def test_returns_first_line_of_section(self, tmp_path):
+        path = tmp_path / "context.md"
+        path.write_text("# Context\n\n## Current Focus\n\nShipping v2\nSecond line\n")
+        assert extract_current_focus(path) == "Shipping v2"
+
+    def test_empty_section(self, tmp_path):
+        path = tmp_path / "context.md"
+        path.write_text("## Current Focus\n\n## Next\nNot focus\n")
+        assert extract_current_focus(path) is None
+
+    def test_truncates_long_focus(self, tmp_path):
+        path = tmp_path / "context.md"
+        path.write_text("## current focus\n" + "x" * 80 + "\n")
+        assert extract_current_focus(path) == "x" * 57 + "..."
+
+    def test_missing_file(self, tmp_path):
+        assert extract_current_focus(tmp_path / "context.md") is None
+
+
+class TestInitProjectGitignore:
+    """Tests for the .gitignore handling in init_project()."""
+
+    def test_appends_entry_once(self, tmp_path):
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n")
+
+        actions = init_project(tmp_path)
+        assert "Added .continuum/ to .gitignore" in actions
+        assert gitignore.read_text() == "node_modules/\n\n# Continuum local context\n.continuum/\n"
+
+        actions = init_project(tmp_path)
+        assert "Added .continuum/ to .gitignore" not in actions
+        assert gitignore.read_text().count(".continuum/") == 1
+
+    def test_no_gitignore(self, tmp_path):
+        init_project(tmp_path)
+        assert not (tmp_path / ".gitignore").exists()
@@ -1,12 +1,17 @@
 """Tests for MCP server tool handlers."""
 
+import asyncio
+import os
+import time
+
 import pytest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 from continuum.config import Config
-from continuum.mcp_server import server, call_tool
+from continuum.files import append_memory_entries
+from continuum.mcp_server import server, call_tool, list_tools
 
 
 def make_config(tmp_path):
@@ -84,6 +89,64 @@ class TestCallTool:
         assert "Chose pytest" in text
         assert "Test fact" not in text
 
+    @pytest.mark.asyncio
+    async def test_get_memories_category_matches_entry_label_only(self, tmp_path):
+        config = make_config(tmp_path)
+        config.memory_path.write_text(
+            "# Memory\n\n"
+            "[2024-03-01] Decision - Lowercase label\n"
+            "[2024-02-01] FACT - Mentions ] DECISION later\n"
+            "  [2024-01-01] DECISION - Indented\n"
+        )
+        with patch("continuum.mcp_server.get_config", return_value=config):
+            result = await call_tool("get_memories", {"category": "decision"})
+        assert result[0].text.splitlines() == [
+            "[2024-03-01] Decision - Lowercase label",
+            "[2024-01-01] DECISION - Indented",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_memories_limit_keeps_most_recent(self, tmp_path):
+        config = make_config(tmp_path)
+        config.memory_path.write_text(
+            "# Memory\n\n"
+            "[2024-03-01] FACT - March\n"
+            "[2024-01-01] FACT - January\n"
+            "[2024-02-01] FACT - February\n"
+        )
+        with patch("continuum.mcp_server.get_config", return_value=config):
+            result = await call_tool("get_memories", {"limit": 2})
+        assert result[0].text.splitlines() == [
+            "[2024-03-01] FACT - March",
+            "[2024-02-01] FACT - February",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_memories_parses_unchanged_file_once(self, tmp_path):
+        import continuum.mcp_server as mcp_server
+
+        config = make_config(tmp_path)
+        parse = patch(
+            "continuum.mcp_server._parse_memory_file", wraps=mcp_server._parse_memory_file
+        )
+        with patch("continuum.mcp_server.get_config", return_value=config), parse as parsed:
+            await call_tool("get_memories", {})
+            await call_tool("get_memories", {"category": "decision"})
+            await call_tool("get_memories", {"search": "pytest"})
+        assert parsed.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_memories_sees_new_entries(self, tmp_path):
+        config = make_config(tmp_path)
+        with patch("continuum.mcp_server.get_config", return_value=config):
+            await call_tool("get_memories", {})
+            await call_tool("remember", {"text": "Remembered", "category": "fact"})
+            with config.memory_path.open("a") as f:
+                f.write("\n[2024-01-01] LESSON - Appended by hand")
+            result = await call_tool("get_memories", {})
+        assert "Remembered" in result[0].text
+        assert "Appended by hand" in result[0].text
+
     @pytest.mark.asyncio
     async def test_remember(self, tmp_path):
         config = make_config(tmp_path)
@@ -95,6 +158,71 @@ class TestCallTool:
         memory_content = config.memory_path.read_text()
         assert "New memory entry" in memory_content
 
+    @pytest.mark.asyncio
+    async def test_remember_burst_is_written_in_one_batch(self, tmp_path):
+        config = make_config(tmp_path)
+        texts = [f"Burst entry {i}" for i in range(5)]
+        with (
+            patch("continuum.mcp_server.get_config", return_value=config),
+            patch(
+                "continuum.mcp_server.append_memory_entries",
+                wraps=append_memory_entries,
+            ) as writer,
+        ):
+            results = await asyncio.gather(
+                *(call_tool("remember", {"text": t}) for t in texts)
+            )
+
+        assert all("Saved" in r[0].text for r in results)
+        assert writer.call_count == 1
+        assert writer.call_args.kwargs["fsync"] is True
+        lines = config.memory_path.read_text().splitlines()
+        assert [line.split(" - ", 1)[1] for line in lines[-5:]] == texts
+
+    @pytest.mark.asyncio
+    async def test_remember_unencodable_text_fails_only_its_caller(self, tmp_path):
+        config = make_config(tmp_path)
+        with patch("continuum.mcp_server.get_config", return_value=config):
+            bad, good = await asyncio.wait_for(
+                asyncio.gather(
+                    call_tool("remember", {"text": "bad \ud800 entry"}),
+                    call_tool("remember", {"text": "Good entry"}),
+                    return_exceptions=True,
+                ),
+                timeout=5,
+            )
+
+        assert isinstance(bad, UnicodeEncodeError)
+        assert "Saved" in good[0].text
+        assert "Good entry" in config.memory_path.read_text()
+
+    @pytest.mark.asyncio
+    async def test_remember_write_error_reaches_callers_of_that_file_only(self, tmp_path):
+        from continuum.mcp_server import _memory_writer
+
+        failing = tmp_path / "failing.md"
+        working = tmp_path / "working.md"
+        working.write_text("# Memory\n")
+
+        def append(path, entries, fsync=False):
+            if path == failing:
+                raise RuntimeError("disk on fire")
+            append_memory_entries(path, entries, fsync=fsync)
+
+        with patch("continuum.mcp_server.append_memory_entries", side_effect=append):
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    _memory_writer.append(failing, "A"),
+                    _memory_writer.append(failing, "B"),
+                    _memory_writer.append(working, "C"),
+                    return_exceptions=True,
+                ),
+                timeout=5,
+            )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError, type(None)]
+        assert working.read_text() == "# Memory\n\nC"
+
     @pytest.mark.asyncio
     async def test_remember_empty_text(self, tmp_path):
         config = make_config(tmp_path)
@@ -111,9 +239,53 @@ class TestCallTool:
         assert "identity.md" in text
         assert "Memories" in text
 
+    @pytest.mark.asyncio
+    async def test_get_status_file_ages(self, tmp_path):
+        config = make_config(tmp_path)
+        old = time.time() - 3 * 86400 - 60
+        os.utime(config.voice_path, (old, old))
+        config.context_path.unlink()
+        with patch("continuum.mcp_server.get_config", return_value=config):
+            result = await call_tool("get_status", {})
+        text = result[0].text
+        assert "  identity.md: 0d old" in text
+        assert "  voice.md: 3d old" in text
+        assert "  context.md: missing" in text
+
     @pytest.mark.asyncio
     async def test_unknown_tool(self, tmp_path):
         config = make_config(tmp_path)
         with patch("continuum.mcp_server.get_config", return_value=config):
             result = await call_tool("nonexistent_tool", {})
         assert "Unknown tool" in result[0].text
+
+
+class TestListTools:
+    """Tests for MCP list_tools handler."""
+
+    @pytest.mark.asyncio
+    async def test_lists_every_handled_tool(self):
+        from continuum.mcp_server import _HANDLERS
+
+        tools = await list_tools()
+        assert [t.name for t in tools] == list(_HANDLERS)
+
+    @pytest.mark.asyncio
+    async def test_returns_independent_lists(self):
+        first = await list_tools()
+        first.clear()
+        second = await list_tools()
+        assert len(second) == 7
+
+
+class TestGetServer:
+    """Tests for the lazily built MCP server."""
+
+    def test_built_once_with_tool_handlers(self):
+        from mcp.types import CallToolRequest, ListToolsRequest
+
+        from continuum.mcp_server import get_server
+
+        assert get_server() is get_server() is server
+        assert ListToolsRequest in server.request_handlers
+        assert CallToolRequest in server.request_handlers
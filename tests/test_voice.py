@@ -1,9 +1,23 @@
 """Tests for voice module."""
 
+import asyncio
+import json
+
+import httpx
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
+from continuum.config import Config
 from continuum.voice import (
+    ANALYSIS_PROMPT,
+    VoiceAnalysisResult,
+    analyze_voice,
+    analyze_voice_batch,
+    build_prompt,
+    call_openrouter,
+    call_openrouter_async,
+    fix_broken_json_strings,
     parse_analysis,
     collect_samples,
     generate_voice_md,
@@ -39,6 +53,25 @@ class TestParseAnalysis:
         assert result is not None
         assert "core_dna" in result
 
+    def test_prefers_json_tagged_block(self):
+        response = '```\n{"from": "plain"}\n```\ntext\n```json\n{"from": "tagged"}\n```'
+        assert parse_analysis(response) == {"from": "tagged"}
+
+    def test_uppercase_json_tag(self):
+        response = '```JSON\n{"core_dna": {}}\n```'
+        assert parse_analysis(response) == {"core_dna": {}}
+
+    def test_skips_unparseable_blocks(self):
+        response = '```bash\nls -la\n```\n\n```\n{"ok": true}\n```'
+        assert parse_analysis(response) == {"ok": True}
+
+    def test_falls_back_to_python_literal(self):
+        response = "```json\n{'do_patterns': ['Be brief'], 'long_form': None}\n```"
+        assert parse_analysis(response) == {"do_patterns": ["Be brief"], "long_form": None}
+
+    def test_ignores_non_dict_literal(self):
+        assert parse_analysis("```\n['a', 'b'\n```") is None
+
     def test_returns_none_for_no_json(self):
         response = "This is just text with no JSON at all."
         result = parse_analysis(response)
@@ -49,6 +82,74 @@ class TestParseAnalysis:
         result = parse_analysis(response)
         assert result is None
 
+    def test_raw_json_followed_by_braced_prose(self):
+        response = 'Here you go: {"a": "x } y", "b": {}} Edit anything in {braces} freely.'
+        assert parse_analysis(response) == {"a": "x } y", "b": {}}
+
+    def test_tries_each_candidate_once(self):
+        import continuum.voice as voice
+
+        response = '```json\n{invalid}\n```\n```\n{invalid}\n```'
+        with patch("continuum.voice._try_parse", wraps=voice._try_parse) as try_parse:
+            assert parse_analysis(response) is None
+
+        assert try_parse.call_count == 2  # the block, then the outer brace span
+
+
+class TestImportCost:
+    """The voice module must stay cheap to import."""
+
+    def test_does_not_import_httpx(self):
+        import subprocess
+        import sys
+
+        code = "import sys, continuum.voice; print('httpx' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+
+class TestFixBrokenJsonStrings:
+    """Tests for fix_broken_json_strings()."""
+
+    def test_replaces_newlines_inside_strings_only(self):
+        broken = '{\n  "a": "line one\nline two",\n  "b": "x\r\ny"\n}'
+        assert fix_broken_json_strings(broken) == '{\n  "a": "line one line two",\n  "b": "x  y"\n}'
+
+    def test_respects_escaped_quotes(self):
+        broken = '{"a": "say \\"hi\\"\nthere", "b": 1}'
+        assert fix_broken_json_strings(broken) == '{"a": "say \\"hi\\" there", "b": 1}'
+
+    def test_unterminated_string(self):
+        assert fix_broken_json_strings('{"a": "open\nend') == '{"a": "open end'
+
+
+class TestBuildPrompt:
+    """Tests for build_prompt()."""
+
+    def test_sections_and_truncation(self):
+        prompt = build_prompt({"emails": ["Hi", "x" * 5001], "general": ["Note"]})
+
+        assert prompt.startswith(ANALYSIS_PROMPT)
+        assert prompt[len(ANALYSIS_PROMPT) :] == (
+            "\n## EMAILS SAMPLES\n\n"
+            "\n--- Sample 1 ---\nHi\n"
+            f"\n--- Sample 2 ---\n{'x' * 5000}\n[... truncated ...]\n"
+            "\n## GENERAL SAMPLES\n\n"
+            "\n--- Sample 1 ---\nNote\n"
+        )
+
+    def test_no_per_sample_fences(self):
+        prompt = build_prompt({"general": ["one", "two", "three"]})
+
+        assert prompt[len(ANALYSIS_PROMPT) :].count("```") == 0
+
+    def test_total_budget_shrinks_each_sample(self):
+        prompt = build_prompt({"general": ["a" * 100, "b" * 100]}, max_total_chars=100)
+
+        assert "a" * 50 + "\n[... truncated ...]" in prompt
+        assert "a" * 51 not in prompt
+        assert "b" * 50 + "\n[... truncated ...]" in prompt
+
 
 class TestCollectSamples:
     """Tests for collect_samples()."""
@@ -63,6 +164,52 @@ class TestCollectSamples:
         assert "emails" in result
         assert len(result["emails"]) == 2
 
+    def test_keeps_directory_order_across_many_files(self, tmp_path):
+        emails = tmp_path / "emails"
+        emails.mkdir()
+        for i in range(40):
+            (emails / f"s{i:02d}.md").write_text(f"Sample {i}")
+        (tmp_path / "root.txt").write_text("Root sample")
+
+        result = collect_samples(tmp_path)
+
+        expected = [f.read_text() for f in emails.glob("*")]
+        assert result["emails"] == expected
+        assert result["general"] == ["Root sample"]
+
+    def test_skips_duplicate_bodies(self, tmp_path):
+        emails = tmp_path / "emails"
+        emails.mkdir()
+        (emails / "a.md").write_text("Same reply")
+        (emails / "b.md").write_text("Same reply")
+        (emails / "c.md").write_text("Different")
+        (tmp_path / "copy.txt").write_text("Same reply")
+
+        result = collect_samples(tmp_path)
+
+        # Only the first copy is kept, whichever category the walk reaches first
+        all_samples = [c for contents in result.values() for c in contents]
+        assert sorted(all_samples) == ["Different", "Same reply"]
+
+    def test_suffixes_match_case_insensitively(self, tmp_path):
+        (tmp_path / "NOTES.MD").write_text("Upper-case suffix")
+        (tmp_path / "photo.JPG").write_text("not text")
+
+        assert collect_samples(tmp_path) == {"general": ["Upper-case suffix"]}
+
+    def test_skips_hidden_entries(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main")
+        (tmp_path / ".DS_Store").write_bytes(b"\x00\x00\x00\x01Bud1")
+        emails = tmp_path / "emails"
+        emails.mkdir()
+        (emails / ".draft.md").write_text("Hidden draft")
+        (emails / "sent.md").write_text("Sent email")
+
+        result = collect_samples(tmp_path)
+
+        assert result == {"emails": ["Sent email"]}
+
     def test_collects_from_root_as_general(self, tmp_path):
         (tmp_path / "sample.md").write_text("A general sample.")
 
@@ -141,6 +288,36 @@ class TestGenerateVoiceMd:
         assert "Direct" in result
         assert "Use concrete examples" in result
 
+    def test_full_document(self):
+        analysis = {
+            "core_dna": {"primary_qualities": ["Warm"], "defining_tensions": ["Direct but kind"]},
+            "tone_spectrum": {"casual": "Loose", "formal": "Measured"},
+            "do_patterns": ["Lead with the ask"],
+            "dont_patterns": [],
+            "vocabulary": {
+                "signature_phrases": {"acknowledgments": ["Got it", "Thanks"], "transitions": []},
+                "banned_phrases": ["circle back"],
+            },
+            "structure": {"list_usage": "Bullets for steps", "common_templates": [{"template": "Done: [x]"}]},
+            "formatting": {"avoid": ["Emoji"]},
+            "long_form": {"typical_length": "500 words", "characteristics": ["Headers"]},
+        }
+
+        assert generate_voice_md(analysis) == (
+            "# Voice Profile\n\n\n"
+            "## Core DNA\n\n**Direct but kind**\n\n- Warm\n\n"
+            "## Tone Spectrum\n\n- **Casual (Teams/Slack)**: Loose\n"
+            "- **Formal (Exec/External)**: Measured\n\n"
+            "## Do\n\n- Lead with the ask\n\n"
+            "## Vocabulary\n\n### Signature Phrases\n\n"
+            '- **Acknowledgments**: "Got it", "Thanks"\n\n'
+            '### Avoid\n\n- "circle back"\n\n'
+            "## Structural Patterns\n\n**List usage**: Bullets for steps\n\n"
+            "**Template**:\n```\nDone: [x]\n```\n\n"
+            "## Formatting\n\n\n"
+            "## Long-Form Writing\n\n**Typical length**: 500 words\n\n- Headers\n"
+        )
+
     def test_handles_empty_analysis(self):
         result = generate_voice_md({})
         assert "# Voice Profile" in result
@@ -170,3 +347,302 @@ class TestGenerateVoiceMd:
         assert "Got it" in result
         assert "synergy" in result
         assert "circle back" in result
+
+
+class TestAnalyzeVoice:
+    """Tests for analyze_voice()."""
+
+    def test_reports_sample_count(self, tmp_path):
+        samples = tmp_path / "samples"
+        (samples / "emails").mkdir(parents=True)
+        (samples / "emails" / "one.md").write_text("First email")
+        (samples / "emails" / "two.md").write_text("Second email")
+        (samples / "note.txt").write_text("A note")
+        config = Config._from_dict({}, tmp_path)
+
+        response = '```json\n{"do_patterns": ["Be brief"]}\n```'
+        with patch("continuum.voice.call_openrouter", return_value=response):
+            result = analyze_voice(config, samples, api_key="test-key")
+
+        assert result.error is None
+        assert result.sample_count == 3
+        assert result.parsed == {"do_patterns": ["Be brief"]}
+
+    def test_result_is_immutable(self):
+        result = VoiceAnalysisResult(raw_response="", parsed=None)
+        with pytest.raises(AttributeError):
+            result.error = "changed"
+        assert not hasattr(result, "__dict__")
+
+    def test_no_samples(self, tmp_path):
+        config = Config._from_dict({}, tmp_path)
+
+        result = analyze_voice(config, tmp_path / "samples", api_key="test-key")
+
+        assert result.error is not None
+        assert "No samples found" in result.error
+        assert result.sample_count == 0
+
+    def test_records_phase_timings(self, tmp_path):
+        samples = tmp_path / "samples"
+        samples.mkdir()
+        (samples / "note.txt").write_text("A note")
+        config = Config._from_dict({}, tmp_path)
+
+        response = '{"do_patterns": ["Be brief"]}'
+        with patch("continuum.voice.call_openrouter", return_value=response):
+            fresh = analyze_voice(config, samples, api_key="k")
+            cached = analyze_voice(config, samples, api_key="k")
+
+        assert list(fresh.timings) == ["collect", "prompt", "request", "parse"]
+        assert all(secs >= 0 for secs in fresh.timings.values())
+        assert list(cached.timings) == ["collect", "prompt"]
+
+    def test_reuses_cached_analysis(self, tmp_path):
+        samples = tmp_path / "samples"
+        samples.mkdir()
+        (samples / "note.txt").write_text("A note")
+        config = Config._from_dict({}, tmp_path)
+
+        response = '{"do_patterns": ["Be brief"]}'
+        with patch("continuum.voice.call_openrouter", return_value=response) as call:
+            first = analyze_voice(config, samples, api_key="k")
+            second = analyze_voice(config, samples, api_key="k")
+            assert call.call_count == 1
+
+            analyze_voice(config, samples, api_key="k", use_cache=False)
+            analyze_voice(config, samples, api_key="k", model="other/model")
+            assert call.call_count == 3
+
+        assert first.cached is False
+        assert second.cached is True
+        assert second.parsed == first.parsed
+        assert second.sample_count == 1
+
+    def test_does_not_cache_unparseable_response(self, tmp_path):
+        samples = tmp_path / "samples"
+        samples.mkdir()
+        (samples / "note.txt").write_text("A note")
+        config = Config._from_dict({}, tmp_path)
+
+        with patch("continuum.voice.call_openrouter", return_value="no json") as call:
+            analyze_voice(config, samples, api_key="k")
+            analyze_voice(config, samples, api_key="k")
+
+        assert call.call_count == 2
+
+
+class TestCallOpenrouter:
+    """Tests for call_openrouter()."""
+
+    def test_posts_through_shared_client(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("continuum.voice._sync_client", return_value=client):
+            assert call_openrouter("prompt", "k") == "ok"
+            assert call_openrouter("prompt", "k") == "ok"
+
+        assert len(requests) == 2
+        assert not client.is_closed
+
+    def test_stream_stops_after_json_object(self):
+        deltas = ['```json\n{"a": ', '"x\\"}"', ', "b": {}}', "\n```", " and more"]
+        body = ": OPENROUTER PROCESSING\n\n" + "".join(
+            f"data: {json.dumps({'choices': [{'delta': {'content': d}}]})}\n\n" for d in deltas
+        ) + "data: [DONE]\n\n"
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("continuum.voice._sync_client", return_value=client):
+            text = call_openrouter("prompt", "k", stream=True)
+
+        assert sent[0]["stream"] is True
+        assert text == '```json\n{"a": "x\\"}", "b": {}}'
+        assert parse_analysis(text) == {"a": 'x"}', "b": {}}
+
+    def test_stream_error_event(self):
+        body = 'data: {"error": {"message": "rate limited"}}\n\n'
+
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, text=body)))
+        with patch("continuum.voice._sync_client", return_value=client):
+            with pytest.raises(RuntimeError, match="rate limited"):
+                call_openrouter("prompt", "k", stream=True)
+
+    def test_stream_error_event_with_string_error(self):
+        body = 'data: {"error": "upstream overloaded"}\n\n'
+
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, text=body)))
+        with patch("continuum.voice._sync_client", return_value=client):
+            with pytest.raises(RuntimeError, match="upstream overloaded"):
+                call_openrouter("prompt", "k", stream=True)
+
+    def test_streamed_error_body_is_reported(self, tmp_path):
+        class Body(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b"bad key"
+
+        samples = tmp_path / "samples"
+        samples.mkdir()
+        (samples / "note.txt").write_text("A note")
+        config = Config._from_dict({}, tmp_path)
+
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda r: httpx.Response(401, stream=Body()))
+        )
+        with patch("continuum.voice._sync_client", return_value=client):
+            result = analyze_voice(config, samples, api_key="k", use_cache=False)
+
+        assert result.error == "API error: 401 - bad key"
+
+    def test_stream_skips_frames_without_choices(self):
+        frames = [
+            {"choices": [{"delta": {"content": '{"a": '}}]},
+            {"choices": [], "usage": {"prompt_tokens": 10}},
+            {"choices": [{"delta": {"content": "1}"}}]},
+        ]
+        body = "".join(f"data: {json.dumps(f)}\n\n" for f in frames) + "data: [DONE]\n\n"
+
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, text=body)))
+        with patch("continuum.voice._sync_client", return_value=client):
+            assert call_openrouter("prompt", "k", stream=True) == '{"a": 1}'
+
+    def test_retries_transient_errors(self):
+        statuses = [429, 503, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("continuum.voice._sync_client", return_value=client):
+            assert call_openrouter("prompt", "k") == "ok"
+        assert statuses == []
+
+    def test_does_not_retry_client_errors(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(401, text="bad key")
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("continuum.voice._sync_client", return_value=client):
+            with pytest.raises(httpx.HTTPStatusError):
+                call_openrouter("prompt", "k", stream=True)
+        assert len(calls) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with (
+            patch("continuum.voice._sync_client", return_value=client),
+            patch("continuum.voice.time.sleep") as sleep,
+        ):
+            with pytest.raises(httpx.HTTPStatusError):
+                call_openrouter("prompt", "k")
+        assert len(calls) == 5
+        # Exponential backoff with jitter: 1-2s, 2-3s, 4-5s, 8-9s
+        for delay, base in zip((c.args[0] for c in sleep.call_args_list), (1, 2, 4, 8)):
+            assert base <= delay < base + 1
+
+
+class TestAnalyzeVoiceBatch:
+    """Tests for analyze_voice_batch() and call_openrouter_async()."""
+
+    def test_results_in_model_order(self, tmp_path):
+        samples = tmp_path / "samples"
+        samples.mkdir()
+        (samples / "note.txt").write_text("A note")
+        config = Config._from_dict({}, tmp_path)
+
+        async def fake_call(prompt, api_key, model, max_tokens=8000, client=None, semaphore=None):
+            if model == "broken":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01 if model == "slow" else 0)
+            return f'{{"do_patterns": ["{model}"]}}'
+
+        with patch("continuum.voice.call_openrouter_async", side_effect=fake_call):
+            results = asyncio.run(
+                analyze_voice_batch(config, ["slow", "broken", "fast"], samples, api_key="k")
+            )
+
+        assert results[0].parsed == {"do_patterns": ["slow"]}
+        assert results[1].error == "Error calling API: boom"
+        assert results[2].parsed == {"do_patterns": ["fast"]}
+        assert all(r.sample_count == 1 for r in results)
+
+    def test_no_api_key(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        config = Config._from_dict({}, tmp_path)
+
+        results = asyncio.run(analyze_voice_batch(config, ["a", "b"], tmp_path))
+
+        assert len(results) == 2
+        assert all("OPENROUTER_API_KEY" in r.error for r in results)
+
+    def test_call_openrouter_async_uses_client(self):
+        def handler(request):
+            assert request.headers["Authorization"] == "Bearer k"
+            return httpx.Response(200, json={"choices": [{"message": {"content": "hi"}}]})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await call_openrouter_async("prompt", "k", client=client)
+
+        assert asyncio.run(run()) == "hi"
+
+    def test_marks_prompt_prefix_for_caching(self):
+        prompt = build_prompt({"general": ["Hello"]})
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+        async def run(model):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                await call_openrouter_async(prompt, "k", model, client=client)
+
+        asyncio.run(run("anthropic/claude-sonnet-4"))
+        asyncio.run(run("openai/gpt-4o"))
+
+        blocks = sent[0]["messages"][0]["content"]
+        assert blocks[0]["text"] == ANALYSIS_PROMPT
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert "".join(b["text"] for b in blocks) == prompt
+        # Other providers get the plain string
+        assert sent[1]["messages"][0]["content"] == prompt
+
+    def test_async_retry_with_semaphore(self):
+        statuses = [429, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+        async def run():
+            semaphore = asyncio.Semaphore(1)
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await call_openrouter_async(
+                    "prompt", "k", client=client, semaphore=semaphore
+                )
+
+        assert asyncio.run(run()) == "ok"